@@ -18,6 +18,8 @@ from shared import (
     load_documents,
     OutputManager,
     EmbeddingCache,
+    QueryCache,
+    make_preview,
 )
 from utils import print_header, print_step, print_success, get_user_query, display_results
 
@@ -36,9 +38,8 @@ def setup_vector_store(embedder, documents_path, cache):
     # Check if embedding is needed
     if cache.needs_embedding(COLLECTION_NAME, documents, vector_store):
         print_step("🔢 Generating embeddings...")
-        doc_contents = [doc["content"] for doc in documents]
         doc_ids = [doc["id"] for doc in documents]
-        embeddings = embedder.embed(doc_contents)
+        embeddings = cache.embed_documents(documents, embedder)
         print_success(f"Generated {len(embeddings)} embeddings")
 
         print_step("🗄️  Setting up Qdrant collection...")
@@ -66,27 +67,35 @@ def setup_vector_store(embedder, documents_path, cache):
     return vector_store
 
 
-def search_query(query, embedder, vector_store):
+def search_query(query, embedder, vector_store, query_cache=None):
     """Execute search for a query and return formatted results."""
-    query_embedding = embedder.embed_query(query)
-    search_results = vector_store.search(
+    if query_cache is not None:
+        return query_cache.get_or_compute(
+            query,
+            embedder.embed_query,
+            lambda query_embedding: run_search(query_embedding, vector_store),
+        )
+
+    return run_search(embedder.embed_query(query), vector_store)
+
+
+def run_search(query_embedding, vector_store):
+    """Search Qdrant with a query embedding and return formatted results."""
+    # Payloads come back with the hits, so no per-result metadata lookups
+    search_results = vector_store.search_with_payload(
         collection_name=COLLECTION_NAME,
         query_vector=query_embedding,
         top_k=Config.DEFAULT_TOP_K
     )
 
     results = []
-    for rank, (doc_id, score) in enumerate(search_results, 1):
-        doc_metadata = vector_store.get_metadata(COLLECTION_NAME, doc_id)
-        content = doc_metadata.get("content", "") if doc_metadata else ""
-        preview = content[:500] + "..." if len(content) > 500 else content
-
+    for rank, (doc_id, score, payload) in enumerate(search_results, 1):
         results.append({
             "rank": rank,
             "score": float(score),
             "document_id": doc_id,
-            "path": doc_metadata.get("path", "") if doc_metadata else "",
-            "preview": preview
+            "path": payload.get("path", ""),
+            "preview": make_preview(payload.get("content", ""), 500)
         })
 
     return results
@@ -133,6 +142,7 @@ def main():
     embedder = Embedder()
     output_manager = OutputManager(output_path)
     cache = EmbeddingCache(cache_dir)
+    query_cache = QueryCache()
 
     print_header("Level 01: Basic Vector Search with Qdrant")
 
@@ -146,7 +156,7 @@ def main():
         if not query:
             break
 
-        results = search_query(query, embedder, vector_store)
+        results = search_query(query, embedder, vector_store, query_cache)
         display_results(results, query)
         save_results(query, results, output_manager, output_path)
 
@@ -15,7 +15,7 @@ from typing import List, Dict
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared import Config, Embedder, QdrantVectorStore, load_documents, OutputManager, EmbeddingCache
+from shared import Config, Embedder, QdrantVectorStore, load_documents, load_text_files, DocumentStore, OutputManager, EmbeddingCache
 
 from utils.config import DOCUMENTS_PATH, OUTPUT_PATH, TOP_K
 from utils.vector_retriever import VectorRetriever
@@ -24,20 +24,17 @@ from utils.bm25_retriever import BM25Retriever
 COLLECTION_NAME = "level_02_dual_search"
 
 
-def format_results(results: List[tuple], documents: List[Dict]) -> List[Dict]:
+def format_results(results: List[tuple], doc_store: DocumentStore) -> List[Dict]:
     """Format retriever results into display-friendly structure."""
-    doc_map = {doc["id"]: doc for doc in documents}
-
     formatted = []
     for rank, (doc_id, score) in enumerate(results, 1):
-        doc = doc_map.get(doc_id, {})
-        content = doc.get("content", "").strip()
+        row = doc_store.row(doc_id)
         formatted.append({
             "rank": rank,
             "score": float(score),
             "document_id": doc_id,
-            "path": doc.get("path", ""),
-            "preview": content[:200] + "..." if len(content) > 200 else content
+            "path": doc_store.paths[row] if row >= 0 else "",
+            "preview": doc_store.previews[row] if row >= 0 else ""
         })
 
     return formatted
@@ -97,28 +94,21 @@ def main():
 
     # Also load citizen documents
     citizens_path = Path(__file__).parent / "citizens"
-    if citizens_path.exists() and citizens_path.is_dir():
-        for doc_file in citizens_path.glob("*.txt"):
-            try:
-                with open(doc_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    documents.append({
-                        "id": f"citizens/{doc_file.name}",
-                        "path": str(doc_file),
-                        "content": content,
-                    })
-            except Exception as e:
-                print(f"Warning: Failed to load {doc_file}: {e}")
+    documents.extend(load_text_files(citizens_path, "citizens"))
 
     print(f"✅ Loaded {len(documents)} documents\n")
 
+    # Columnar copy with a single id -> row map, shared by the vector retriever
+    # and every format_results call
+    doc_store = DocumentStore(documents)
+
     # Initialize retrievers
     print("🔧 Initializing retrievers...")
     vector_retriever = VectorRetriever(COLLECTION_NAME, embedder, vector_store, cache)
     bm25_retriever = BM25Retriever(documents)
 
     # Index documents
-    vector_retriever.index(documents)
+    vector_retriever.index(documents, doc_store.id_to_row)
     bm25_retriever.index()
     print()
 
@@ -136,15 +126,21 @@ def main():
         }
     ]
 
+    # Score every query against the vector index in one batch, then trim per query
+    batch_vector_results = vector_retriever.batch_search(
+        [query_info["query"] for query_info in queries],
+        k=max(query_info["k"] for query_info in queries)
+    )
+
     all_results = []
-    for query_info in queries:
+    for query_info, vector_hits in zip(queries, batch_vector_results):
         query = query_info["query"]
         print(f"🔍 Query {queries.index(query_info) + 1}: '{query}'")
         print(f"   → {query_info['description']}\n")
 
         # Get results from both methods
-        vector_results = format_results(vector_retriever.search(query, k=query_info["k"]), documents)
-        bm25_results = format_results(bm25_retriever.search(query, k=query_info["k"]), documents)
+        vector_results = format_results(vector_hits[:query_info["k"]], doc_store)
+        bm25_results = format_results(bm25_retriever.search(query, k=query_info["k"]), doc_store)
 
         # Print comparison
         print_comparison(vector_results, bm25_results)
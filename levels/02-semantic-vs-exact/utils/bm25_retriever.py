@@ -1,7 +1,14 @@
 """BM25 keyword search retriever."""
 
+import sys
+from pathlib import Path
 from typing import List, Dict, Tuple
-from rank_bm25 import BM25Okapi
+import numpy as np
+
+# Add shared module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.retrieval import SparseBM25, tokenize, tokenize_query, top_k_indices
 
 
 class BM25Retriever:
@@ -16,46 +23,53 @@ class BM25Retriever:
         """
         self.documents = documents
         self.bm25 = None
+        self.doc_ids = np.array([], dtype=object)
 
     def index(self):
         """Build BM25 index from documents."""
         print("📚 Building BM25 index...")
 
-        # Tokenize documents (simple whitespace tokenization)
-        tokenized_docs = [doc["content"].lower().split() for doc in self.documents]
+        # Tokenize documents
+        tokenized_docs = [tokenize(doc["content"]) for doc in self.documents]
+
+        # Ids as an array so results are gathered by index instead of per-dict lookups
+        self.doc_ids = np.array([doc["id"] for doc in self.documents], dtype=object)
 
         # Build BM25 index
-        self.bm25 = BM25Okapi(tokenized_docs)
+        self.bm25 = SparseBM25(tokenized_docs)
 
         print(f"✅ Indexed {len(self.documents)} documents")
 
-    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+    def get_scores(self, query: str) -> np.ndarray:
         """
-        Search for documents using BM25.
+        Score every indexed document against a query.
 
         Args:
             query: Search query string
-            k: Number of top results to return
 
         Returns:
-            List of (document_id, score) tuples sorted by relevance
+            Array of BM25 scores aligned with self.documents
         """
         if self.bm25 is None:
             raise ValueError("Must call index() before searching")
 
-        # Tokenize query
-        tokenized_query = query.lower().split()
+        return self.bm25.get_scores(tokenize_query(query))
 
-        # Get BM25 scores
-        scores = self.bm25.get_scores(tokenized_query)
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Search for documents using BM25.
+
+        Args:
+            query: Search query string
+            k: Number of top results to return
 
-        # Get top-k indices
-        top_indices = scores.argsort()[::-1][:k]
+        Returns:
+            List of (document_id, score) tuples sorted by relevance
+        """
+        # Get BM25 scores
+        scores = self.get_scores(query)
 
-        results = []
-        for idx in top_indices:
-            doc_id = self.documents[idx]["id"]
-            score = float(scores[idx])
-            results.append((doc_id, score))
+        # Get top-k indices (partial selection, only the k winners are sorted)
+        top_indices = top_k_indices(scores, k)
 
-        return results
+        return list(zip(self.doc_ids[top_indices].tolist(), scores[top_indices].tolist()))
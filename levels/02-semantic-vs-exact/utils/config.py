@@ -21,3 +21,4 @@ OUTPUT_PATH = SharedConfig.get_output_path("02-hybrid-search")
 # Hybrid Search specific configuration
 ALPHA = 0.5  # Weight for semantic search (0.0 = pure keyword, 1.0 = pure semantic)
 RRF_K = 60   # Constant for Reciprocal Rank Fusion
+QUERY_EMBEDDING_CACHE_SIZE = 1024  # Query embeddings kept in memory per VectorRetriever
@@ -1,14 +1,30 @@
 """Hybrid retriever combining vector and keyword search."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Dict, Tuple
-from collections import defaultdict
+import numpy as np
+
 from .vector_retriever import VectorRetriever
 from .bm25_retriever import BM25Retriever
 from .config import RRF_K
 
+# Ranks covered by the precomputed RRF weight table; longer lists extend it
+RRF_TABLE_SIZE = 4096
+
+# Vector search waits on the network while BM25 runs on the CPU, so the two
+# retrievers are queried side by side. One pool serves every HybridRetriever.
+_search_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hybrid")
+
+# Add shared module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.retrieval import top_k_indices
+
 
 class HybridRetriever:
-    """Combines vector and BM25 search using Reciprocal Rank Fusion."""
+    """Combines vector and BM25 search using Reciprocal Rank Fusion or score fusion."""
 
     def __init__(self, vector_retriever: VectorRetriever, bm25_retriever: BM25Retriever):
         """
@@ -21,6 +37,16 @@ class HybridRetriever:
         self.vector_retriever = vector_retriever
         self.bm25_retriever = bm25_retriever
 
+        # 1 / (RRF_K + rank) for ranks 1..RRF_TABLE_SIZE, so fusion only scales a slice
+        self._rrf_base = self._rrf_weights(RRF_TABLE_SIZE)
+
+        # Document ids interned to ints so fusion accumulates into arrays.
+        # Seeded from whatever the retrievers hold now; ids seen later are added.
+        self._id_to_idx: Dict[str, int] = {}
+        self._idx_to_id: List[str] = []
+        for documents in (vector_retriever.documents, bm25_retriever.documents):
+            self._intern(doc["id"] for doc in documents)
+
     def search(self, query: str, k: int = 5, alpha: float = 0.5) -> List[Tuple[str, float]]:
         """
         Search using hybrid approach with Reciprocal Rank Fusion.
@@ -33,25 +59,29 @@ class HybridRetriever:
         Returns:
             List of (document_id, score) tuples sorted by fused score
         """
-        # Get results from both retrievers (retrieve more for better fusion)
-        vector_results = self.vector_retriever.search(query, k=k * 2)
+        # Get results from both retrievers concurrently (retrieve more for better fusion)
+        vector_future = _search_pool.submit(self.vector_retriever.search, query, k * 2)
         bm25_results = self.bm25_retriever.search(query, k=k * 2)
+        vector_results = vector_future.result()
 
         # Apply RRF fusion
-        fused_scores = self._reciprocal_rank_fusion(
+        candidates, fused_scores = self._reciprocal_rank_fusion(
             vector_results, bm25_results, alpha=alpha
         )
 
-        # Sort by fused score and return top-k
-        sorted_results = sorted(fused_scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_results[:k]
+        # Select the top-k by fused score without sorting every candidate
+        top = top_k_indices(fused_scores, k)
+        return [
+            (self._idx_to_id[idx], score)
+            for idx, score in zip(candidates[top].tolist(), fused_scores[top].tolist())
+        ]
 
     def _reciprocal_rank_fusion(
         self,
         vector_results: List[Tuple[str, float]],
         bm25_results: List[Tuple[str, float]],
         alpha: float = 0.5
-    ) -> Dict[str, float]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Merge results using Reciprocal Rank Fusion (RRF).
 
@@ -63,18 +93,117 @@ class HybridRetriever:
             alpha: Weight for semantic (vector) vs keyword (BM25)
 
         Returns:
-            Dictionary mapping document_id to fused score
+            Tuple of (interned document indices, fused float32 scores) covering
+            every document that appears in either result list
+        """
+        longest = max(len(vector_results), len(bm25_results))
+        if longest > len(self._rrf_base):
+            self._rrf_base = self._rrf_weights(longest)
+
+        # Rank weights for each list are slices of the precomputed table
+        vector_weights = alpha * self._rrf_base[:len(vector_results)]
+        bm25_weights = (1 - alpha) * self._rrf_base[:len(bm25_results)]
+
+        doc_indices = np.concatenate([
+            self._intern(doc_id for doc_id, _ in vector_results),
+            self._intern(doc_id for doc_id, _ in bm25_results),
+        ])
+        weights = np.concatenate([vector_weights, bm25_weights])
+
+        # Sum weights per distinct document (a document may appear in both lists)
+        candidates, slots = np.unique(doc_indices, return_inverse=True)
+        fused_scores = np.bincount(slots, weights=weights, minlength=len(candidates))
+
+        return candidates, fused_scores.astype(np.float32)
+
+    def _intern(self, doc_ids) -> np.ndarray:
+        """
+        Map document ids to their integer indices, assigning new ones as needed.
+
+        Args:
+            doc_ids: Iterable of document ids
+
+        Returns:
+            int64 array of indices, aligned with doc_ids
         """
-        fused_scores = defaultdict(float)
+        id_to_idx = self._id_to_idx
+        idx_to_id = self._idx_to_id
+        indices = []
+        for doc_id in doc_ids:
+            idx = id_to_idx.get(doc_id)
+            if idx is None:
+                # Unseen ids get the next free index, recorded in both maps
+                idx = len(idx_to_id)
+                id_to_idx[doc_id] = idx
+                idx_to_id.append(doc_id)
+            indices.append(idx)
+        return np.array(indices, dtype=np.int64)
+
+    @staticmethod
+    def _rrf_weights(num_ranks: int) -> np.ndarray:
+        """Reciprocal rank weights 1 / (RRF_K + rank) for ranks 1..num_ranks."""
+        return 1.0 / (RRF_K + np.arange(1, num_ranks + 1, dtype=np.float32))
+
+    def fused_search(self, query: str, k: int = 5, alpha: float = 0.5) -> List[Tuple[str, float]]:
+        """
+        Search by fusing the full vector and BM25 score arrays.
+
+        Unlike RRF, which only sees each retriever's top results, every
+        document is scored by both retrievers and the z-normalized scores
+        are combined in one pass. Intended for corpora small enough to
+        score in full; both retrievers must be indexed over the same documents.
+
+        Args:
+            query: Search query string
+            k: Number of top results to return
+            alpha: Weight for semantic vs keyword (0.0 = pure keyword, 1.0 = pure semantic)
+
+        Returns:
+            List of (document_id, score) tuples sorted by fused score
+        """
+        fused = self._dense_bm25_scores(query, alpha)
+        rows = top_k_indices(fused, k)
 
-        # Add vector search scores (weighted by alpha)
-        for rank, (doc_id, score) in enumerate(vector_results, start=1):
-            rrf_score = alpha / (RRF_K + rank)
-            fused_scores[doc_id] += rrf_score
+        return list(zip(self.bm25_retriever.doc_ids[rows].tolist(), fused[rows].tolist()))
 
-        # Add BM25 scores (weighted by 1-alpha)
-        for rank, (doc_id, score) in enumerate(bm25_results, start=1):
-            rrf_score = (1 - alpha) / (RRF_K + rank)
-            fused_scores[doc_id] += rrf_score
+    def _dense_bm25_scores(self, query: str, alpha: float) -> np.ndarray:
+        """
+        Compute alpha * z(dense) + (1 - alpha) * z(bm25) for every document.
 
-        return dict(fused_scores)
+        Args:
+            query: Search query string
+            alpha: Weight for semantic (vector) vs keyword (BM25)
+
+        Returns:
+            Array of fused scores aligned with the BM25 retriever's documents
+        """
+        dense_future = _search_pool.submit(self.vector_retriever.get_scores, query)
+        sparse = self.bm25_retriever.get_scores(query)
+        dense = dense_future.result()
+
+        if len(dense) != len(sparse):
+            raise ValueError("Vector and BM25 retrievers must index the same documents")
+
+        # Dense scores follow the vector retriever's document order; put them
+        # in BM25's order (which labels the fused results) if the two differ
+        vector_ids = self.vector_retriever.doc_ids
+        bm25_ids = self.bm25_retriever.doc_ids
+        if not np.array_equal(vector_ids, bm25_ids):
+            row_of = self.vector_retriever.row_of
+            try:
+                rows = np.array([row_of[doc_id] for doc_id in bm25_ids.tolist()], dtype=np.int64)
+            except KeyError as e:
+                raise ValueError(
+                    "Vector and BM25 retrievers must index the same documents"
+                ) from e
+            dense = dense[rows]
+
+        return alpha * self._z_normalize(dense) + (1 - alpha) * self._z_normalize(sparse)
+
+    @staticmethod
+    def _z_normalize(scores: np.ndarray) -> np.ndarray:
+        """Z-score normalize scores; constant arrays map to zeros."""
+        std = scores.std()
+        if std == 0:
+            return np.zeros_like(scores, dtype=np.float64)
+        return (scores - scores.mean()) / std
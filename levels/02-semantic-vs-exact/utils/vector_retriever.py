@@ -1,18 +1,27 @@
 """
 Vector search retriever using Qdrant.
 
-This is a wrapper around the shared QdrantVectorStore for Level 02.
+This is a wrapper around the shared QdrantVectorStore for Level 02. A
+unit-normalized copy of the document embeddings is also kept in memory so
+full-corpus scoring (used by score fusion) is a single matrix-vector product.
+That copy is float32: its rounding error in a cosine score is ~1e-7, far
+below any meaningful gap between document scores, so only exact near-ties
+could order differently than at float64.
 """
 
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import numpy as np
 
+from .config import QUERY_EMBEDDING_CACHE_SIZE
+
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from shared import Embedder, QdrantVectorStore, EmbeddingCache
+from shared.retrieval import normalize_embeddings, dot_scores, top_k_indices
 
 
 class VectorRetriever:
@@ -39,30 +48,58 @@ class VectorRetriever:
         self.vector_store = vector_store
         self.cache = cache
         self.documents = []
+        self.row_of: Dict[str, int] = {}
+        self.doc_ids = np.array([], dtype=object)
+        self.embeddings: Optional[np.ndarray] = None
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
-    def index(self, documents: List[Dict]) -> None:
+    def index(self, documents: List[Dict], row_of: Optional[Dict[str, int]] = None) -> None:
         """
         Build vector index from documents.
 
         Args:
             documents: List of document dictionaries with 'id' and 'content'
+            row_of: Optional existing id -> row map for documents (e.g. a
+                DocumentStore's id_to_row), shared instead of rebuilt
         """
         self.documents = documents
+        self.row_of = row_of if row_of is not None else {
+            doc["id"]: row for row, doc in enumerate(documents)
+        }
+        self.doc_ids = np.array([doc["id"] for doc in documents], dtype=object)
 
         # Check if caching is enabled and embeddings are cached
         if self.cache and not self.cache.needs_embedding(
             self.collection_name, documents, self.vector_store
         ):
+            # Prefer the saved normalized matrix; otherwise rebuild it from
+            # cached vectors, which costs no API calls
+            self.embeddings = self.cache.load_matrix(
+                self.collection_name, documents, self.embedder.model
+            )
+            if self.embeddings is None:
+                self.embeddings = normalize_embeddings(
+                    self.cache.embed_documents(documents, self.embedder)
+                )
+                self._save_matrix()
+            self._warm_up()
             print(f"✅ Using cached embeddings (collection already exists with {len(documents)} documents)")
             return
 
         print("🔢 Generating embeddings and building vector index...")
 
-        doc_contents = [doc["content"] for doc in documents]
         doc_ids = [doc["id"] for doc in documents]
 
-        # Generate embeddings
-        embeddings = self.embedder.embed(doc_contents)
+        # Generate embeddings (reusing per-document vectors when cached)
+        if self.cache:
+            embeddings = self.cache.embed_documents(documents, self.embedder)
+        else:
+            embeddings = self.embedder.embed([doc["content"] for doc in documents])
+
+        # Normalize once here so every later cosine score is a plain dot product
+        self.embeddings = normalize_embeddings(embeddings)
+        self._save_matrix()
+        self._warm_up()
 
         # Create collection
         self.vector_store.create_collection(
@@ -99,8 +136,8 @@ class VectorRetriever:
         Returns:
             List of (document_id, score) tuples sorted by relevance
         """
-        # Generate query embedding
-        query_embedding = self.embedder.embed_query(query)
+        # Generate query embedding (reused when the query was seen before)
+        query_embedding = self._embed_query(query)
 
         # Search in Qdrant
         results = self.vector_store.search(
@@ -110,3 +147,133 @@ class VectorRetriever:
         )
 
         return results
+
+    def batch_search(self, queries: List[str], k: int = 5) -> List[List[Tuple[str, float]]]:
+        """
+        Search several queries at once.
+
+        All uncached queries are embedded in one API call, and every query is
+        scored against the in-memory matrix with a single matrix-matrix
+        product (one BLAS GEMM instead of a GEMV per query). Falls back to
+        per-query Qdrant search when the matrix is not available.
+
+        Args:
+            queries: Search query strings
+            k: Number of top results to return per query
+
+        Returns:
+            One list of (document_id, score) tuples per query, sorted by relevance
+        """
+        if not queries:
+            return []
+
+        if self.embeddings is None:
+            return [self.search(query, k=k) for query in queries]
+
+        query_matrix = normalize_embeddings(np.stack(self._embed_queries(queries)))
+        scores = query_matrix @ self.embeddings.T
+
+        results = []
+        for row_scores in scores:
+            top = top_k_indices(row_scores, k)
+            results.append(list(zip(self.doc_ids[top].tolist(), row_scores[top].tolist())))
+
+        return results
+
+    def get_scores(self, query: str) -> np.ndarray:
+        """
+        Score every indexed document against a query.
+
+        Uses the in-memory normalized embeddings when available; otherwise
+        asks Qdrant for all points at once, which is only sensible for
+        corpora small enough to score in full.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Array of cosine scores aligned with self.documents
+        """
+        if self.embeddings is not None:
+            return self._cosine_similarity(self._embed_query(query))
+
+        results = self.search(query, k=len(self.documents))
+        rows = [self.row_of.get(doc_id, -1) for doc_id, _ in results]
+        found = np.array([score for _, score in results], dtype=np.float32)
+
+        # Any point the index did not return gets the lowest observed score
+        scores = np.full(len(self.documents), found.min() if len(found) else 0.0, dtype=np.float32)
+        rows = np.array(rows, dtype=np.int64)
+        known = rows >= 0
+        scores[rows[known]] = found[known]
+        return scores
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Embed a query, reusing the vector from earlier calls with the same text.
+
+        The same query is typically embedded several times per run (vector
+        search, hybrid search, score fusion), and each miss is an API call.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Read-only query embedding
+        """
+        return self._embed_queries([query])[0]
+
+    def _embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """
+        Embed queries through the query cache, sending all misses in one request.
+
+        Args:
+            queries: Search query strings
+
+        Returns:
+            Read-only query embeddings, in query order
+        """
+        if not all(queries):
+            raise ValueError("Query string cannot be empty")
+
+        found = {}
+        for query in queries:
+            embedding = self._query_embeddings.get(query)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(query)
+                found[query] = embedding
+
+        missing = [query for query in dict.fromkeys(queries) if query not in found]
+        if missing:
+            for query, embedding in zip(missing, self.embedder.embed(missing)):
+                embedding.setflags(write=False)
+                found[query] = embedding
+                self._query_embeddings[query] = embedding
+                if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                    self._query_embeddings.popitem(last=False)
+
+        return [found[query] for query in queries]
+
+    def _cosine_similarity(self, query_embedding: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of a query against every indexed document.
+
+        Args:
+            query_embedding: Raw query embedding
+
+        Returns:
+            Array of cosine scores aligned with self.documents
+        """
+        return dot_scores(self.embeddings, normalize_embeddings(query_embedding))
+
+    def _save_matrix(self) -> None:
+        """Persist the normalized matrix so later runs can memory-map it."""
+        if self.cache:
+            self.cache.save_matrix(
+                self.collection_name, self.documents, self.embedder.model, self.embeddings
+            )
+
+    def _warm_up(self) -> None:
+        """Run the scoring kernel once so JIT compilation doesn't land on the first query."""
+        if self.embeddings is not None and len(self.embeddings):
+            dot_scores(self.embeddings[:1], self.embeddings[0])
@@ -8,37 +8,83 @@ Compares three fundamental chunking approaches:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
+import numpy as np
 
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared import Config, Embedder, load_documents, OutputManager
+from shared import Config, Embedder, EmbeddingCache, index_documents, load_document, OutputManager
 
-from utils.config import DOCUMENTS_PATH, OUTPUT_PATH, TOP_K
+from utils.config import DOCUMENTS_PATH, OUTPUT_PATH, TOP_K, encode_document
 from utils.fixed_chunker import FixedChunker
 from utils.semantic_chunker import SemanticChunker
 from utils.contextual_chunker import ContextualChunker
 from utils.chunk_evaluator import ChunkEvaluator
+from utils.chunk_table import ChunkTable
+
+
+STATS_DTYPE = np.dtype([
+    ("num_chunks", "i4"),
+    ("avg", "f4"),
+    ("min", "f4"),
+    ("max", "f4"),
+    ("top_score", "f4"),
+])
+
+
+def build_stats_table(evaluations: Dict[str, Dict]) -> np.ndarray:
+    """
+    Collect per-strategy metrics into one structured array.
+
+    Args:
+        evaluations: Mapping of strategy name to evaluate() output
+
+    Returns:
+        Structured array with one record per strategy, in evaluation order
+    """
+    return np.array(
+        [
+            (e["num_chunks"], e["avg_chunk_size"], e.get("min_chunk_size", 0),
+             e.get("max_chunk_size", 0), e.get("top_score", 0.0))
+            for e in evaluations.values()
+        ],
+        dtype=STATS_DTYPE,
+    )
+
+
+def format_stats_rows(strategies: List[str], stats: np.ndarray) -> List[str]:
+    """
+    Format the stats table (header, rule, rows) once for console and file output.
+
+    Args:
+        strategies: Strategy names aligned with stats
+        stats: Output of build_stats_table()
+
+    Returns:
+        List of table lines
+    """
+    lines = [
+        f"{'Strategy':<15} {'Chunks':>8} {'Avg Size':>10} {'Min':>8} {'Max':>8} {'Top Score':>12}",
+        "-" * 100,
+    ]
+    for strategy, (num_chunks, avg, min_size, max_size, top_score) in zip(strategies, stats.tolist()):
+        lines.append(
+            f"{strategy:<15} {num_chunks:>8} {avg:>10.1f} "
+            f"{min_size:>8.0f} {max_size:>8.0f} {top_score:>12.4f}"
+        )
+    return lines
 
 
-def print_comparison_table(evaluations: Dict[str, Dict]):
+def print_comparison_table(table_lines: List[str]):
     """Print comparison table to console."""
     print(f"\n{'=' * 100}")
     print("CHUNKING STRATEGIES COMPARISON")
     print(f"{'=' * 100}\n")
 
-    print(f"{'Strategy':<15} {'Chunks':>8} {'Avg Size':>10} {'Min':>8} {'Max':>8} {'Top Score':>12}")
-    print(f"{'-' * 100}")
-
-    for strategy, eval_data in evaluations.items():
-        print(f"{strategy:<15} {eval_data['num_chunks']:>8} "
-              f"{eval_data['avg_chunk_size']:>10.1f} "
-              f"{eval_data['min_chunk_size']:>8.0f} "
-              f"{eval_data['max_chunk_size']:>8.0f} "
-              f"{eval_data['top_score']:>12.4f}")
-
+    print("\n".join(table_lines))
     print(f"{'-' * 100}\n")
 
 
@@ -49,155 +95,207 @@ def main():
 
     # Initialize components
     cache_dir = Config.SHARED_PATH / "data"
-    embedder = Embedder()
+    # Chunk texts repeat across runs (and across strategies), so vectors are
+    # reused from the shared embedding store instead of re-requested
+    embedder = Embedder(cache=EmbeddingCache(cache_dir))
     output_manager = OutputManager(OUTPUT_PATH)
 
-    print("=" * 100)
-    print("Level 03: Chunking Strategies Comparison")
-    print("=" * 100)
+    # Output files are written in the background so disk I/O overlaps the
+    # embedding and evaluation work; failures surface before the summary
+    with ThreadPoolExecutor(max_workers=2) as writer:
+        pending_writes = []
+
+        print("=" * 100)
+        print("Level 03: Chunking Strategies Comparison")
+        print("=" * 100)
+
+        # Index documents by id; only the selected one is read from disk
+        print("\n📄 Loading documents...")
+        doc_paths = index_documents(DOCUMENTS_PATH)
+        if not doc_paths:
+            raise ValueError(f"No documents found in {DOCUMENTS_PATH}")
+
+        # Select one document for detailed analysis
+        test_id = next(
+            (doc_id for doc_id in doc_paths if "ml-systems-design" in doc_id),
+            next(iter(doc_paths))  # Fallback to first document
+        )
+        test_doc = load_document(test_id, doc_paths[test_id])
+        if test_doc is None:
+            raise ValueError(f"Could not read document {test_id}")
+
+        print(f"📋 Analyzing document: {test_doc['id']}")
+        print(f"   Length: {len(test_doc['content'])} characters\n")
+
+        # Initialize evaluator with caching
+        evaluator = ChunkEvaluator(embedder, cache_dir)
+
+        # Initialize chunkers
+        fixed_chunker = FixedChunker()
+        semantic_chunker = SemanticChunker()
+        contextual_chunker = ContextualChunker(cache_dir=cache_dir)
+
+        # Process with each chunking strategy
+        print("🔪 Chunking document...")
+
+        # Tokenize once into a compact array; the token-based chunkers slice this
+        # instead of re-encoding
+        doc_tokens = encode_document(test_doc["content"])
+
+        # Contextual enrichment is dominated by LLM round trips, so start it in the
+        # background while the CPU-bound chunkers run here (its per-chunk progress
+        # output is suppressed so it doesn't interleave with theirs)
+        contextual_pool = ThreadPoolExecutor(max_workers=1)
+        contextual_future = contextual_pool.submit(
+            contextual_chunker.chunk, test_doc["content"], test_doc["id"], False, doc_tokens
+        )
 
-    # Load documents
-    print("\n📄 Loading documents...")
-    documents = load_documents(DOCUMENTS_PATH)
-    print(f"✅ Loaded {len(documents)} documents\n")
+        try:
+            print("\n1. Fixed-Size Chunking (Simple, fast, predictable)...")
+            fixed_chunks = fixed_chunker.chunk(test_doc["content"], test_doc["id"], doc_tokens)
+            print(f"   Created {len(fixed_chunks)} chunks")
+
+            print("\n2. Semantic Chunking (Natural boundaries with overlap)...")
+            semantic_chunks = semantic_chunker.chunk(test_doc["content"], test_doc["id"])
+            print(f"   Created {len(semantic_chunks)} chunks")
+
+            print("\n3. Contextual Retrieval (LLM-based enrichment)...")
+            print("   This may take a minute as we generate context for each chunk...")
+            cost_estimate = contextual_chunker.estimate_cost(test_doc["content"], tokens=doc_tokens)
+            print(f"   Estimated cost: ${cost_estimate['total_cost_usd']:.4f} for {cost_estimate['num_chunks']} chunks")
+            contextual_chunks = contextual_future.result()
+        finally:
+            # On an error or Ctrl-C, stop the enrichment from issuing further
+            # (paid) context requests instead of letting it run to completion
+            if not contextual_future.done():
+                contextual_chunker.cancel()
+            contextual_pool.shutdown(wait=False, cancel_futures=True)
+        print(f"   Created {len(contextual_chunks)} enriched chunks "
+              f"({contextual_chunker.stats['hits']} contexts reused from cache)")
+
+        # Save chunks
+        print("\n💾 Saving chunks...")
+        pending_writes.append(writer.submit(output_manager.save_results, "fixed_chunks", {"chunks": fixed_chunks}))
+        pending_writes.append(writer.submit(output_manager.save_results, "semantic_chunks", {"chunks": semantic_chunks}))
+        pending_writes.append(writer.submit(output_manager.save_results, "contextual_chunks", {"chunks": contextual_chunks}))
+
+        # Evaluate with a query
+        query = "How do you handle model training and deployment?"
+        print(f"\n🔍 Evaluating with query: '{query}'")
+
+        # Columnar views shared by embedding, evaluation and visualization
+        fixed_table = ChunkTable(fixed_chunks)
+        semantic_table = ChunkTable(semantic_chunks)
+        contextual_table = ChunkTable(contextual_chunks)
+
+        # One embedding request covers all three strategies plus the query
+        fixed_embeddings, semantic_embeddings, contextual_embeddings = evaluator.embed_all(
+            [fixed_table, semantic_table, contextual_table], [query]
+        )
+        query_embedding = evaluator.query_embeddings[query]
 
-    # Select one document for detailed analysis
-    test_doc = next(
-        (doc for doc in documents if "ml-systems-design" in doc["id"]),
-        documents[0]  # Fallback to first document
-    )
+        print("\n   Evaluating fixed chunks...")
+        fixed_eval = evaluator.evaluate_with_embeddings(
+            fixed_table, fixed_embeddings, query, k=TOP_K, query_embedding=query_embedding
+        )
 
-    print(f"📋 Analyzing document: {test_doc['id']}")
-    print(f"   Length: {len(test_doc['content'])} characters\n")
-
-    # Initialize evaluator with caching
-    evaluator = ChunkEvaluator(embedder, cache_dir)
-
-    # Initialize chunkers
-    fixed_chunker = FixedChunker()
-    semantic_chunker = SemanticChunker()
-    contextual_chunker = ContextualChunker()
-
-    # Process with each chunking strategy
-    print("🔪 Chunking document...")
-
-    print("\n1. Fixed-Size Chunking (Simple, fast, predictable)...")
-    fixed_chunks = fixed_chunker.chunk(test_doc["content"], test_doc["id"])
-    print(f"   Created {len(fixed_chunks)} chunks")
-
-    print("\n2. Semantic Chunking (Natural boundaries with overlap)...")
-    semantic_chunks = semantic_chunker.chunk(test_doc["content"], test_doc["id"])
-    print(f"   Created {len(semantic_chunks)} chunks")
-
-    print("\n3. Contextual Retrieval (LLM-based enrichment)...")
-    print("   This may take a minute as we generate context for each chunk...")
-    # Estimate cost first
-    cost_estimate = contextual_chunker.estimate_cost(test_doc["content"])
-    print(f"   Estimated cost: ${cost_estimate['total_cost_usd']:.4f} for {cost_estimate['num_chunks']} chunks")
-    contextual_chunks = contextual_chunker.chunk(test_doc["content"], test_doc["id"])
-    print(f"   Created {len(contextual_chunks)} enriched chunks")
-
-    # Save chunks
-    print("\n💾 Saving chunks...")
-    output_manager.save_results("fixed_chunks", {"chunks": fixed_chunks})
-    output_manager.save_results("semantic_chunks", {"chunks": semantic_chunks})
-    output_manager.save_results("contextual_chunks", {"chunks": contextual_chunks})
-
-    # Evaluate with a query
-    query = "How do you handle model training and deployment?"
-    print(f"\n🔍 Evaluating with query: '{query}'")
-
-    print("\n   Evaluating fixed chunks...")
-    fixed_eval = evaluator.evaluate(fixed_chunks, query, k=TOP_K)
-
-    print("   Evaluating semantic chunks...")
-    semantic_eval = evaluator.evaluate(semantic_chunks, query, k=TOP_K)
-
-    print("   Evaluating contextual chunks...")
-    contextual_eval = evaluator.evaluate(contextual_chunks, query, k=TOP_K)
-
-    # Save evaluations
-    print("\n💾 Saving evaluations...")
-    evaluations = {
-        "fixed": fixed_eval,
-        "semantic": semantic_eval,
-        "contextual": contextual_eval
-    }
-
-    for strategy, eval_data in evaluations.items():
-        output_manager.save_results(f"{strategy}_evaluation", eval_data)
-
-    # Save comparison metrics
-    comparison = {
-        "query": query,
-        "strategies": {}
-    }
-
-    for strategy, eval_data in evaluations.items():
-        comparison["strategies"][strategy] = {
-            "num_chunks": eval_data["num_chunks"],
-            "avg_chunk_size": round(eval_data["avg_chunk_size"], 1),
-            "top_score": round(eval_data["top_score"], 4)
-        }
+        print("   Evaluating semantic chunks...")
+        semantic_eval = evaluator.evaluate_with_embeddings(
+            semantic_table, semantic_embeddings, query, k=TOP_K, query_embedding=query_embedding
+        )
 
-    output_manager.save_results("comparison_metrics", comparison)
+        print("   Evaluating contextual chunks...")
+        contextual_eval = evaluator.evaluate_with_embeddings(
+            contextual_table, contextual_embeddings, query, k=TOP_K, query_embedding=query_embedding
+        )
 
-    # Create visualization text
-    viz_lines = [
-        "Chunking Strategies Comparison",
-        f"Query: {query}",
-        "=" * 100,
-        "",
-        "Strategy Metrics:",
-        "-" * 100,
-        f"{'Strategy':<15} {'Chunks':>8} {'Avg Size':>10} {'Top Score':>12}",
-        "-" * 100,
-    ]
+        # Save evaluations
+        print("\n💾 Saving evaluations...")
+        evaluations = {
+            "fixed": fixed_eval,
+            "semantic": semantic_eval,
+            "contextual": contextual_eval
+        }
 
-    for strategy, eval_data in evaluations.items():
-        viz_lines.append(
-            f"{strategy:<15} {eval_data['num_chunks']:>8} "
-            f"{eval_data['avg_chunk_size']:>10.1f} "
-            f"{eval_data['top_score']:>12.4f}"
-        )
+        for strategy, eval_data in evaluations.items():
+            pending_writes.append(writer.submit(output_manager.save_results, f"{strategy}_evaluation", eval_data))
+
+        # Gather metrics once; the JSON, the text file and the console all reuse them
+        strategies = list(evaluations)
+        stats = build_stats_table(evaluations)
+        table_lines = format_stats_rows(strategies, stats)
+
+        # Save comparison metrics
+        comparison = {
+            "query": query,
+            "strategies": {
+                strategy: {
+                    "num_chunks": num_chunks,
+                    "avg_chunk_size": round(avg, 1),
+                    "top_score": round(top_score, 4)
+                }
+                for strategy, num_chunks, avg, top_score in zip(
+                    strategies,
+                    stats["num_chunks"].tolist(),
+                    stats["avg"].tolist(),
+                    stats["top_score"].tolist(),
+                )
+            }
+        }
 
-    viz_lines.append("-" * 100)
-    viz_lines.append("")
+        pending_writes.append(writer.submit(output_manager.save_results, "comparison_metrics", comparison))
 
-    # Top results for each strategy
-    for strategy, eval_data in evaluations.items():
-        viz_lines.append(f"\n{strategy.upper()} - Top Results:")
-        viz_lines.append("-" * 100)
-        for result in eval_data["results"]:
-            viz_lines.append(
-                f"  #{result['rank']} (Score: {result['score']:.4f}, "
-                f"{result['num_tokens']} tokens)"
-            )
-            viz_lines.append(f"  {result['text']}\n")
-
-    output_manager.save_text("chunk_visualization.txt", "\n".join(viz_lines))
-
-    # Print comparison
-    print_comparison_table(evaluations)
-
-    # Print visualizations
-    print("\nChunk Size Distributions:")
-    for strategy, chunks in [("Fixed", fixed_chunks), ("Semantic", semantic_chunks),
-                              ("Contextual", contextual_chunks)]:
-        print(f"\n{strategy}:")
-        viz = evaluator.visualize_chunks(chunks)
-        print(viz)
-
-    # Print top results
-    print(f"\n{'=' * 100}")
-    print("TOP RETRIEVED CHUNKS")
-    print(f"{'=' * 100}\n")
+        # Create visualization text
+        viz_lines = [
+            "Chunking Strategies Comparison",
+            f"Query: {query}",
+            "=" * 100,
+            "",
+            "Strategy Metrics:",
+            "-" * 100,
+            *table_lines,
+        ]
 
-    for strategy, eval_data in evaluations.items():
-        print(f"{strategy.upper()}:")
-        for result in eval_data["results"][:2]:  # Show top 2
-            print(f"  #{result['rank']} - Score: {result['score']:.4f}")
-            print(f"  {result['text'][:150]}...\n")
+        viz_lines.append("-" * 100)
+        viz_lines.append("")
+
+        # Top results for each strategy
+        for strategy, eval_data in evaluations.items():
+            viz_lines.append(f"\n{strategy.upper()} - Top Results:")
+            viz_lines.append("-" * 100)
+            for result in eval_data["results"]:
+                viz_lines.append(
+                    f"  #{result['rank']} (Score: {result['score']:.4f}, "
+                    f"{result['num_tokens']} tokens)"
+                )
+                viz_lines.append(f"  {result['text']}\n")
+
+        pending_writes.append(writer.submit(output_manager.save_text, "chunk_visualization.txt", "\n".join(viz_lines)))
+
+        # Print comparison
+        print_comparison_table(table_lines)
+
+        # Build the visualizations and top results as lines, then print once
+        report = ["\nChunk Size Distributions:"]
+        for strategy, table in [("Fixed", fixed_table), ("Semantic", semantic_table),
+                                 ("Contextual", contextual_table)]:
+            report.append(f"\n{strategy}:")
+            report.append(evaluator.visualize_chunks(table))
+
+        report.append(f"\n{'=' * 100}")
+        report.append("TOP RETRIEVED CHUNKS")
+        report.append(f"{'=' * 100}\n")
+
+        for strategy, eval_data in evaluations.items():
+            report.append(f"{strategy.upper()}:")
+            for result in eval_data["results"][:2]:  # Show top 2
+                report.append(f"  #{result['rank']} - Score: {result['score']:.4f}")
+                report.append(f"  {result['text'][:150]}...\n")
+
+        print("\n".join(report))
+
+        for write in pending_writes:
+            write.result()
 
     print("\n✅ Analysis complete!")
     print(f"\nOutput files saved to {OUTPUT_PATH}/:")
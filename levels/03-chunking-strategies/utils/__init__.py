@@ -1 +1,10 @@
 """Utility modules for chunking strategies."""
+
+import sys
+from pathlib import Path
+
+# Make the shared module importable for every utils submodule (done once here
+# rather than in each module)
+_LEVELS_PATH = str(Path(__file__).parent.parent.parent)
+if _LEVELS_PATH not in sys.path:
+    sys.path.insert(0, _LEVELS_PATH)
@@ -1,16 +1,19 @@
 """Evaluation and comparison utilities for chunking strategies."""
 
-import sys
+import atexit
+import os
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import numpy as np
 import hashlib
-import json
 
-# Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared import Embedder, make_preview
+from shared.retrieval import top_k_indices, normalize_embeddings, dot_scores
+from .chunk_table import ChunkTable
 
-from shared import Embedder
+# Chunk lists as returned by the chunkers, or their columnar ChunkTable view
+Chunks = Union[List[Dict], ChunkTable]
 
 
 class ChunkEvaluator:
@@ -20,49 +23,125 @@ class ChunkEvaluator:
         """
         Initialize the evaluator.
 
+        Chunk embeddings are kept L2-normalized as rows of one float16 matrix
+        plus a hash -> row map, so scoring a query is a single dot product.
+        With a cache_dir, the matrix and the row hashes are saved as .npy
+        files and the matrix is memory-mapped on the next run, so loading
+        costs no parsing. New rows are written back once, at exit (or on
+        flush()), and only if any were added.
+
         Args:
             embedder: Embedder instance for generating embeddings
             cache_dir: Optional directory for caching chunk embeddings
         """
         self.embedder = embedder
         self.cache_dir = cache_dir
-        self.embedding_cache = {}
+        self.vectors: Optional[np.ndarray] = None
+        self.row_of: Dict[str, int] = {}
+        self.query_embeddings: Dict[str, np.ndarray] = {}
+        self._dirty = False
 
         if cache_dir:
             self.cache_dir = Path(cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.cache_file = self.cache_dir / "chunk_embeddings_cache.json"
+            self.vectors_file = self.cache_dir / "chunk_embeddings.npy"
+            self.hashes_file = self.cache_dir / "chunk_embedding_hashes.npy"
             self._load_cache()
+            atexit.register(self.flush)
 
     def _load_cache(self):
-        """Load embedding cache from disk."""
-        if self.cache_file and self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r") as f:
-                    cache_data = json.load(f)
-                    # Convert lists back to numpy arrays
-                    self.embedding_cache = {
-                        k: np.array(v) for k, v in cache_data.items()
-                    }
-            except (json.JSONDecodeError, IOError):
-                self.embedding_cache = {}
+        """Memory-map cached chunk embeddings and rebuild their hash -> row map."""
+        if not self.vectors_file.exists() or not self.hashes_file.exists():
+            return
+
+        try:
+            hashes = np.load(self.hashes_file)
+            vectors = np.load(self.vectors_file, mmap_mode="r")
+        except (OSError, ValueError):
+            return
+
+        # A run interrupted between the two writes leaves mismatched files; ignore them
+        if vectors.ndim == 2 and len(vectors) == len(hashes):
+            self.vectors = vectors
+            self.row_of = {chunk_hash: row for row, chunk_hash in enumerate(hashes.tolist())}
+
+    def flush(self) -> None:
+        """Write the cache to disk if embeddings were added since the last write."""
+        if self.cache_dir and self._dirty:
+            self._save_cache()
+            self._dirty = False
 
     def _save_cache(self):
-        """Save embedding cache to disk."""
-        if self.cache_file:
-            try:
-                # Convert numpy arrays to lists for JSON serialization
-                cache_data = {
-                    k: v.tolist() for k, v in self.embedding_cache.items()
-                }
-                with open(self.cache_file, "w") as f:
-                    json.dump(cache_data, f)
-            except IOError:
-                pass
+        """Save chunk embeddings and their row hashes to disk."""
+        try:
+            self._save_array(self.vectors_file, self.vectors)
+            self._save_array(self.hashes_file, np.array(list(self.row_of), dtype=str))
+        except OSError:
+            pass
+
+    def _save_array(self, path: Path, array: np.ndarray) -> None:
+        """
+        Write an array as .npy atomically (temp file in the same directory, then rename).
+
+        Readers never see a half-written file, and a memory map of the old
+        file stays valid because the rename swaps in a new inode.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _add_embeddings(self, chunk_hashes: List[str], embeddings: np.ndarray) -> None:
+        """
+        Normalize new chunk embeddings, append them as rows and mark the
+        cache for writing.
+
+        Args:
+            chunk_hashes: Hashes of the embedded chunks (not yet cached)
+            embeddings: Matching embeddings (len(chunk_hashes) x embedding_dim)
+        """
+        # Normalized once here; every later cosine score is a plain dot product.
+        # Unit vectors lose < 1e-3 in cosine at float16, and the cache halves.
+        embeddings = normalize_embeddings(embeddings).astype(np.float16)
+        first_row = len(self.row_of)
+
+        if self.vectors is None:
+            self.vectors = embeddings
+        else:
+            self.vectors = np.concatenate([self.vectors, embeddings])
+
+        for offset, chunk_hash in enumerate(chunk_hashes):
+            self.row_of[chunk_hash] = first_row + offset
+
+        self._dirty = True
+
+    def _embed_by_length(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts in length order and return the embeddings in input order.
+
+        Sorting puts similarly sized texts in the same embedder batch, so a
+        backend that pads each batch to its longest input wastes little work.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings aligned with texts
+        """
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_embeddings = self.embedder.embed([texts[i] for i in order])
+
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
 
     def _get_chunk_hash(self, chunk_text: str) -> str:
-        """Generate hash for a chunk of text."""
-        return hashlib.sha256(chunk_text.encode()).hexdigest()[:16]
+        """Generate a 64-bit hash for a chunk of text (blake2b, faster than truncated SHA-256)."""
+        return hashlib.blake2b(chunk_text.encode(), digest_size=8).hexdigest()
 
     def _get_embeddings(self, chunk_texts: List[str]) -> np.ndarray:
         """
@@ -74,85 +153,154 @@ class ChunkEvaluator:
         Returns:
             Numpy array of embeddings
         """
-        embeddings = []
-        texts_to_embed = []
-        indices_to_embed = []
+        if not chunk_texts:
+            return np.empty((0, 0), dtype=np.float16)
+
+        chunk_hashes = [self._get_chunk_hash(text) for text in chunk_texts]
+
+        # Embed uncached chunks (each distinct text once)
+        missing = {}
+        for chunk_hash, text in zip(chunk_hashes, chunk_texts):
+            if chunk_hash not in self.row_of:
+                missing.setdefault(chunk_hash, text)
 
-        # Check cache for each chunk
-        for i, text in enumerate(chunk_texts):
-            chunk_hash = self._get_chunk_hash(text)
-            if chunk_hash in self.embedding_cache:
-                embeddings.append((i, self.embedding_cache[chunk_hash]))
-            else:
-                texts_to_embed.append(text)
-                indices_to_embed.append((i, chunk_hash))
+        if missing:
+            self._add_embeddings(list(missing), self._embed_by_length(list(missing.values())))
 
-        # Embed uncached chunks
-        if texts_to_embed:
-            new_embeddings = self.embedder.embed(texts_to_embed)
-            for (idx, chunk_hash), embedding in zip(indices_to_embed, new_embeddings):
-                self.embedding_cache[chunk_hash] = embedding
-                embeddings.append((idx, embedding))
+        # One fancy-index gather pulls every row in chunk order
+        rows = np.fromiter((self.row_of[h] for h in chunk_hashes), dtype=np.int64, count=len(chunk_hashes))
+        return self.vectors[rows]
 
-            # Save cache after generating new embeddings
-            if self.cache_dir:
-                self._save_cache()
+    def embed_all(self, chunk_sets: List[Chunks], queries: List[str]) -> List[np.ndarray]:
+        """
+        Embed every strategy's chunks and the queries in a single batch.
+
+        Identical chunk texts across strategies are embedded once, and the
+        queries ride along in the same request. The embeddings are then
+        split back per strategy for evaluate_with_embeddings().
 
-        # Sort by original index and return as array
-        embeddings.sort(key=lambda x: x[0])
-        return np.array([emb for _, emb in embeddings])
+        Args:
+            chunk_sets: Chunk lists (or ChunkTables), one per chunking strategy
+            queries: Queries that will be evaluated
 
-    def evaluate(self, chunks: List[Dict], query: str, k: int = 3) -> Dict:
+        Returns:
+            One embedding matrix per chunk list, rows in chunk order
+        """
+        text_sets = [ChunkTable.of(chunks).texts for chunks in chunk_sets]
+
+        # Unique uncached texts, in first-seen order
+        missing = {}
+        for texts in text_sets:
+            for text in texts:
+                chunk_hash = self._get_chunk_hash(text)
+                if chunk_hash not in self.row_of:
+                    missing.setdefault(chunk_hash, text)
+
+        new_queries = [q for q in dict.fromkeys(queries) if q not in self.query_embeddings]
+
+        if missing or new_queries:
+            embeddings = self._embed_by_length(list(missing.values()) + new_queries)
+
+            if missing:
+                self._add_embeddings(list(missing), embeddings[:len(missing)])
+            for query, embedding in zip(new_queries, embeddings[len(missing):]):
+                self.query_embeddings[query] = embedding
+
+        # Everything is cached now, so these are pure row gathers
+        return [self._get_embeddings(texts) for texts in text_sets]
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Get a query embedding, reusing one produced by embed_all()."""
+        if query not in self.query_embeddings:
+            self.query_embeddings[query] = self.embedder.embed_query(query)
+        return self.query_embeddings[query]
+
+    def evaluate(
+        self,
+        chunks: Chunks,
+        query: str,
+        k: int = 3,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Dict:
         """
         Evaluate chunking strategy by searching with a query.
 
         Args:
-            chunks: List of chunk dictionaries
+            chunks: List of chunk dictionaries, or their ChunkTable
+            query: Search query
+            k: Number of results to return
+            query_embedding: Optional precomputed embedding of query
+
+        Returns:
+            Dictionary with evaluation metrics and results
+        """
+        table = ChunkTable.of(chunks)
+
+        # Generate embeddings for chunks (with caching)
+        chunk_embeddings = self._get_embeddings(table.texts)
+
+        return self.evaluate_with_embeddings(table, chunk_embeddings, query, k, query_embedding)
+
+    def evaluate_with_embeddings(
+        self,
+        chunks: Chunks,
+        chunk_embeddings: np.ndarray,
+        query: str,
+        k: int = 3,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Evaluate chunking strategy with chunk embeddings computed up front.
+
+        Args:
+            chunks: List of chunk dictionaries, or their ChunkTable
+            chunk_embeddings: Embeddings aligned with chunks (e.g. from embed_all())
             query: Search query
             k: Number of results to return
+            query_embedding: Optional precomputed embedding of query (skips
+                the embedder entirely)
 
         Returns:
             Dictionary with evaluation metrics and results
         """
-        if not chunks:
+        table = ChunkTable.of(chunks)
+        if not len(table):
             return {
                 "num_chunks": 0,
                 "avg_chunk_size": 0,
                 "results": []
             }
 
-        # Generate embeddings for chunks (with caching)
-        chunk_texts = [chunk["text"] for chunk in chunks]
-        chunk_embeddings = self._get_embeddings(chunk_texts)
-
-        # Generate query embedding
-        query_embedding = self.embedder.embed_query(query)
+        # Generate query embedding unless the caller already has it
+        if query_embedding is None:
+            query_embedding = self._embed_query(query)
 
         # Compute similarities
         similarities = self._cosine_similarity_batch(query_embedding, chunk_embeddings)
 
-        # Get top-k
-        top_indices = np.argsort(similarities)[::-1][:k]
+        # Get top-k (partial selection, only the k winners are sorted)
+        top_indices = top_k_indices(similarities, k)
 
-        results = []
-        for rank, idx in enumerate(top_indices, 1):
-            results.append({
+        # Result fields are gathered column-wise for the k winners only
+        results = [
+            {
                 "rank": rank,
-                "chunk_id": chunks[idx]["chunk_id"],
-                "score": float(similarities[idx]),
-                "text": chunks[idx]["text"][:200] + "..." if len(chunks[idx]["text"]) > 200 else chunks[idx]["text"],
-                "num_tokens": chunks[idx]["num_tokens"]
-            })
-
-        # Calculate metrics
-        token_counts = [chunk["num_tokens"] for chunk in chunks]
+                "chunk_id": chunk_id,
+                "score": score,
+                "text": make_preview(table.texts[idx], 200),
+                "num_tokens": num_tokens
+            }
+            for rank, (idx, chunk_id, score, num_tokens) in enumerate(zip(
+                top_indices.tolist(),
+                table.chunk_ids[top_indices].tolist(),
+                similarities[top_indices].tolist(),
+                table.num_tokens[top_indices].tolist(),
+            ), 1)
+        ]
 
         return {
-            "num_chunks": len(chunks),
-            "avg_chunk_size": np.mean(token_counts),
-            "min_chunk_size": np.min(token_counts),
-            "max_chunk_size": np.max(token_counts),
-            "std_chunk_size": np.std(token_counts),
+            "num_chunks": len(table),
+            **table.token_stats(),
             "results": results,
             "top_score": float(similarities[top_indices[0]]) if len(top_indices) > 0 else 0.0
         }
@@ -165,40 +313,44 @@ class ChunkEvaluator:
 
         Args:
             query_embedding: 1D array of query embedding
-            doc_embeddings: 2D array of document embeddings
+            doc_embeddings: 2D array of L2-normalized document embeddings
+                (float16 rows are upcast to float32 for the product)
 
         Returns:
             1D array of similarity scores
         """
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        doc_norms = doc_embeddings / np.linalg.norm(doc_embeddings, axis=1, keepdims=True)
-        similarities = np.dot(doc_norms, query_norm)
-        return similarities
+        # Rows are normalized at insertion, so only the query needs scaling
+        doc_embeddings = np.ascontiguousarray(doc_embeddings, dtype=np.float32)
+        return dot_scores(doc_embeddings, normalize_embeddings(query_embedding))
 
     @staticmethod
-    def visualize_chunks(chunks: List[Dict], max_width: int = 100) -> str:
+    def visualize_chunks(chunks: Chunks, max_width: int = 100) -> str:
         """
         Create ASCII visualization of chunks.
 
         Args:
-            chunks: List of chunk dictionaries
+            chunks: List of chunk dictionaries, or their ChunkTable
             max_width: Maximum width of visualization
 
         Returns:
             ASCII art string showing chunk boundaries
         """
-        if not chunks:
+        table = ChunkTable.of(chunks)
+        if not len(table):
             return "No chunks to visualize"
 
-        lines = []
-        lines.append("\nChunk Visualization:")
-        lines.append("=" * max_width)
-
-        for i, chunk in enumerate(chunks):
-            chunk_width = min(chunk["num_tokens"] // 10, max_width - 10)
-            bar = "█" * chunk_width
-            lines.append(f"Chunk {i:2d} [{chunk['num_tokens']:4d} tokens]: {bar}")
-
-        lines.append("=" * max_width)
+        # Every possible bar is built once; each row just indexes into it
+        max_bar = max(max_width - 10, 0)
+        bars = ["█" * width for width in range(max_bar + 1)]
+        row = "Chunk {:2d} [{:4d} tokens]: {}".format
+
+        rule = "=" * max_width
+        lines = ["\nChunk Visualization:", rule]
+        widths = np.minimum(table.num_tokens // 10, max_bar)
+        lines.extend(
+            row(i, num_tokens, bars[width])
+            for i, (num_tokens, width) in enumerate(zip(table.num_tokens.tolist(), widths.tolist()))
+        )
+        lines.append(rule)
 
         return "\n".join(lines)
@@ -0,0 +1,52 @@
+"""
+Columnar (structure-of-arrays) view of a chunker's output.
+
+Chunkers return a list of dicts, which is what gets saved as JSON. Evaluation,
+statistics and visualization only need a few fields, so ChunkTable keeps them
+as parallel arrays: token statistics become single NumPy reductions and result
+rows are read by index.
+"""
+
+from typing import Dict, List, Union
+
+import numpy as np
+
+
+class ChunkTable:
+    """Parallel arrays of chunk ids, texts and token counts."""
+
+    def __init__(self, chunks: List[Dict]):
+        """
+        Build the columns from chunk dictionaries.
+
+        Args:
+            chunks: Chunk dicts with 'chunk_id', 'text' and 'num_tokens'
+        """
+        self.chunk_ids = np.array([chunk["chunk_id"] for chunk in chunks], dtype=object)
+        self.texts: List[str] = [chunk["text"] for chunk in chunks]
+        self.num_tokens = np.fromiter(
+            (chunk["num_tokens"] for chunk in chunks), dtype=np.int32, count=len(chunks)
+        )
+
+    @classmethod
+    def of(cls, chunks: Union[List[Dict], "ChunkTable"]) -> "ChunkTable":
+        """Return chunks as a ChunkTable, building one only if needed."""
+        return chunks if isinstance(chunks, cls) else cls(chunks)
+
+    def __len__(self) -> int:
+        """Number of chunks in the table."""
+        return len(self.texts)
+
+    def token_stats(self) -> Dict[str, float]:
+        """
+        Summarize chunk sizes.
+
+        Returns:
+            Dict with avg/min/max/std chunk size in tokens (the table must not be empty)
+        """
+        return {
+            "avg_chunk_size": self.num_tokens.mean(),
+            "min_chunk_size": self.num_tokens.min(),
+            "max_chunk_size": self.num_tokens.max(),
+            "std_chunk_size": self.num_tokens.std(),
+        }
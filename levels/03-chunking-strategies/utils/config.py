@@ -1,10 +1,9 @@
 """Configuration constants for chunking strategies."""
 
-import sys
-from pathlib import Path
+from array import array
+from functools import lru_cache
 
-# Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import tiktoken
 
 from shared import Config as SharedConfig
 
@@ -21,21 +20,67 @@ OUTPUT_PATH = SharedConfig.get_output_path("03-chunking-strategies")
 CHUNK_SIZE = 512        # Target chunk size in tokens
 CHUNK_OVERLAP = 51      # Overlap between chunks in tokens (10% of CHUNK_SIZE for default)
 SEMANTIC_THRESHOLD = 0.5  # Similarity threshold for semantic chunking
+ENCODING_NAME = "cl100k_base"
+# Sentence splitter for semantic chunking: "blingfire", "pysbd", "nltk", or
+# "auto" (the first one installed, in that order; NLTK is always available)
+SENTENCE_SPLITTER = "auto"
+
+
+@lru_cache(maxsize=4)
+def get_encoder(name: str = ENCODING_NAME) -> tiktoken.Encoding:
+    """
+    Return the tokenizer shared by every chunker (built once per process).
+
+    Args:
+        name: tiktoken encoding name
+
+    Returns:
+        Cached Encoding instance for name
+    """
+    return tiktoken.get_encoding(name)
+
+
+def encode_document(text: str) -> array:
+    """
+    Tokenize a whole document into a compact token id array.
+
+    A list of token ids costs ~36 bytes per token (pointer plus int object);
+    a uint32 array costs 4. Chunkers slice and decode it like a list.
+
+    Args:
+        text: Document text
+
+    Returns:
+        array('I') of token ids
+    """
+    return array("I", get_encoder().encode(text))
 
 # Contextual Retrieval Configuration
-# Uses LLM_MODEL from shared config
-CONTEXT_INSTRUCTIONS_TEMPLATE = """You are generating context for a document chunk to improve search retrieval.
+# Uses LLM_MODEL from shared config. The prompt is split so the large document
+# block is an identical prefix for every chunk of a document (cacheable by the
+# provider) and only the small chunk block varies.
+CONTEXT_DOCUMENT_TEMPLATE = """You are generating context for a document chunk to improve search retrieval.
 
 <document>
 {document}
-</document>
+</document>"""
 
-Here is the chunk we want to situate within the whole document:
+CONTEXT_CHUNK_TEMPLATE = """Here is the chunk we want to situate within the whole document:
 <chunk>
 {chunk}
 </chunk>
 
 Please give a short succinct context to situate this chunk within the overall document for the purposes of improving search retrieval of the chunk. Answer only with the succinct context and nothing else."""
 
+# Mark the document block with cache_control so providers that support explicit
+# prompt caching (e.g. Anthropic models via OpenAI-compatible gateways) bill
+# repeat reads at ~10% of the input price. Disable for endpoints that reject it.
+USE_PROMPT_CACHING = True
+# Without prompt caching, send only this many tokens on each side of a chunk
+# instead of the whole document with every request (0 = always whole document)
+CONTEXT_WINDOW_TOKENS = 2048
+CONTEXT_MAX_CONCURRENT = 16  # Context requests in flight at once
+CONTEXT_MAX_RETRIES = 5      # Retries (exponential backoff) on 429/5xx and timeouts
+
 # Retrieval Configuration
 TOP_K = 3               # Number of chunks to retrieve
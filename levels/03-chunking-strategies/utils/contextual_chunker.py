@@ -5,17 +5,43 @@ Based on Anthropic's Contextual Retrieval approach.
 Significantly improves retrieval accuracy by providing context for each chunk.
 """
 
-import sys
+import asyncio
+import hashlib
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional
-from openai import OpenAI
-import tiktoken
+from typing import List, Dict, Optional, Sequence, Tuple
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
-# Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    import h2  # noqa: F401 - lets httpx multiplex requests over HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 from shared import Config
-from .config import CHUNK_SIZE, CHUNK_OVERLAP, CONTEXT_INSTRUCTIONS_TEMPLATE
+from shared.io import dumps_json, loads_json
+from .config import (
+    CHUNK_SIZE,
+    CHUNK_OVERLAP,
+    CONTEXT_DOCUMENT_TEMPLATE,
+    CONTEXT_CHUNK_TEMPLATE,
+    USE_PROMPT_CACHING,
+    CONTEXT_WINDOW_TOKENS,
+    CONTEXT_MAX_CONCURRENT,
+    CONTEXT_MAX_RETRIES,
+    get_encoder,
+)
+
+# Input price multipliers for cached prompt prefixes (relative to base input price)
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# Used when context generation fails (never cached, so it is retried next run)
+FALLBACK_CONTEXT = "This chunk is from the document."
+
+# Joins a chunk's context and its text in the enriched chunk
+CONTEXT_SEPARATOR = "\n\n"
 
 
 class ContextualChunker:
@@ -35,7 +61,11 @@ class ContextualChunker:
         self,
         chunk_size: int = CHUNK_SIZE,
         chunk_overlap: int = CHUNK_OVERLAP,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        use_prompt_caching: bool = USE_PROMPT_CACHING,
+        max_concurrent: int = CONTEXT_MAX_CONCURRENT,
+        cache_dir: Optional[Path] = None,
+        context_window: int = CONTEXT_WINDOW_TOKENS
     ):
         """
         Initialize the contextual chunker.
@@ -44,19 +74,119 @@ class ContextualChunker:
             chunk_size: Target size of each chunk in tokens
             chunk_overlap: Number of tokens to overlap between chunks
             model: LLM model to use for context generation (uses LLM_MODEL from config if not specified)
+            use_prompt_caching: Mark the document prompt block as cacheable
+            max_concurrent: Maximum concurrent context generation calls
+            cache_dir: Optional directory for caching generated contexts across
+                runs (keyed by model, document and chunk; safe as temperature=0)
+            context_window: Without prompt caching, tokens of surrounding document
+                sent on each side of a chunk (0 sends the whole document)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.model = model or Config.LLM_MODEL
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.use_prompt_caching = use_prompt_caching
+        self.max_concurrent = max_concurrent
+        self.context_window = context_window
+        self.tokenizer = get_encoder()
+        self.separator_tokens = len(self.tokenizer.encode_ordinary(CONTEXT_SEPARATOR))
+
+        # Static template text around {document} and {chunk}: prompts are built
+        # by concatenation, so the document prefix is byte-identical on every
+        # request, and its size is counted once for cost estimates
+        self._document_prefix, self._document_suffix = CONTEXT_DOCUMENT_TEMPLATE.split("{document}")
+        self._chunk_prefix, self._chunk_suffix = CONTEXT_CHUNK_TEMPLATE.split("{chunk}")
+        self.document_template_tokens, self.chunk_template_tokens = (
+            len(ids) for ids in self.tokenizer.encode_ordinary_batch([
+                self._document_prefix + self._document_suffix,
+                self._chunk_prefix + self._chunk_suffix
+            ])
+        )
+
+        self.cache_file = Path(cache_dir) / "context_cache.json" if cache_dir else None
+        self._contexts: Optional[Dict[str, str]] = None
+        self.stats = {"hits": 0, "misses": 0}
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Stop a running enrichment from sending further context requests.
+
+        Safe to call from another thread. Requests already in flight finish;
+        the run then raises RuntimeError. The chunker stays cancelled.
+        """
+        self._cancelled.set()
+
+    def _load_contexts(self) -> Dict[str, str]:
+        """Load the context cache from disk once."""
+        if self._contexts is None:
+            self._contexts = {}
+            if self.cache_file and self.cache_file.exists():
+                try:
+                    self._contexts = loads_json(self.cache_file.read_bytes())
+                except (OSError, ValueError):
+                    self._contexts = {}
+        return self._contexts
+
+    def _save_contexts(self) -> None:
+        """Persist the context cache to disk."""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_bytes(dumps_json(self._contexts, indent=False))
+        except OSError:
+            pass
+
+    def _context_key(self, document_hash: str, chunk: str) -> str:
+        """
+        Compute the cache key for a chunk's context.
+
+        Args:
+            document_hash: Hash of the full document (computed once per run)
+            chunk: Chunk text
+
+        Returns:
+            Hex digest identifying the (model, document, chunk) triple
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model.encode())
+        digest.update(b"\0")
+        digest.update(document_hash.encode())
+        digest.update(b"\0")
+        digest.update(chunk.encode())
+        return digest.hexdigest()
+
+    def _create_client(self) -> AsyncOpenAI:
+        """
+        Create the OpenAI-compatible async client for one enrichment run.
 
-        # Initialize OpenAI-compatible client
-        self.client = OpenAI(
+        A client's connection pool is tied to the event loop it was used in,
+        so each achunk() run gets its own; within a run every request reuses
+        its kept-alive connections (multiplexed over HTTP/2 when h2 is
+        installed), so only the first requests pay for TCP/TLS setup. The
+        client retries rate limits and server errors with exponential backoff.
+        """
+        http_client = DefaultAsyncHttpxClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent,
+                max_keepalive_connections=self.max_concurrent
+            )
+        )
+        return AsyncOpenAI(
             api_key=Config.LLM_API_KEY,
-            base_url=Config.LLM_BASE_URL
+            base_url=Config.LLM_BASE_URL,
+            max_retries=CONTEXT_MAX_RETRIES,
+            http_client=http_client
         )
 
-    def chunk(self, text: str, doc_id: str, show_progress: bool = True) -> List[Dict]:
+    def chunk(
+        self,
+        text: str,
+        doc_id: str,
+        show_progress: bool = True,
+        tokens: Optional[Sequence[int]] = None
+    ) -> List[Dict]:
         """
         Split text into chunks and enrich each with LLM-generated context.
 
@@ -64,40 +194,117 @@ class ContextualChunker:
             text: Full document text
             doc_id: Document identifier
             show_progress: Whether to print progress messages
+            tokens: Optional precomputed tokens of text (e.g. from encode_document())
 
         Returns:
             List of enriched chunk dictionaries with metadata
         """
+        return asyncio.run(self.achunk(text, doc_id, show_progress, tokens))
+
+    async def achunk(
+        self,
+        text: str,
+        doc_id: str,
+        show_progress: bool = True,
+        tokens: Optional[Sequence[int]] = None
+    ) -> List[Dict]:
+        """
+        Async version of chunk(): context requests run concurrently.
+
+        Up to max_concurrent requests are in flight at once, so wall time is
+        roughly (chunks / max_concurrent) round trips instead of one per chunk.
+        Contexts cached by an earlier run are reused without a request.
+
+        Args:
+            text: Full document text
+            doc_id: Document identifier
+            show_progress: Whether to print progress messages
+            tokens: Optional precomputed tokens of text (e.g. from encode_document())
+
+        Returns:
+            List of enriched chunk dictionaries with metadata, in chunk order
+        """
         # Step 1: Create base chunks using fixed-size chunking
-        base_chunks = self._create_base_chunks(text, doc_id)
+        if tokens is None:
+            tokens = self.tokenizer.encode(text)
+        base_chunks = self._create_base_chunks(text, doc_id, tokens)
 
         if show_progress:
             print(f"  Created {len(base_chunks)} base chunks")
             print(f"  Generating contextual enrichment for each chunk...")
 
-        # Step 2: Enrich each chunk with context
-        enriched_chunks = []
-        for i, chunk in enumerate(base_chunks):
-            if show_progress and (i + 1) % 5 == 0:
-                print(f"    Processed {i + 1}/{len(base_chunks)} chunks...")
-
-            # Generate context for this chunk
-            context = self._generate_context(text, chunk["text"])
-
-            # Create enriched chunk
-            enriched_text = f"{context}\n\n{chunk['text']}"
+        # Step 2: Generate context for every chunk concurrently. With prompt
+        # caching the document block is built once and sent as the same prefix
+        # with every request; without it, long documents are cut to a window
+        # around each chunk so every request doesn't upload the whole text.
+        windowed = self._uses_window(len(tokens))
+        document_part = None if windowed else self._document_part(text)
+        digest = hashlib.blake2b(text.encode(), digest_size=16)
+        if windowed:
+            digest.update(f"\0window={self.context_window}".encode())
+        document_hash = digest.hexdigest()
+        contexts_cache = self._load_contexts()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        completed = 0
+        generated = 0
+
+        async def enrich(client: AsyncOpenAI, chunk: Dict) -> Tuple[str, Optional[int]]:
+            nonlocal completed, generated
+            key = self._context_key(document_hash, chunk["text"])
+            context = contexts_cache.get(key)
+            context_tokens = None
+
+            if context is not None:
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+                part = document_part or self._document_part(self._window_text(tokens, chunk))
+                async with semaphore:
+                    if self._cancelled.is_set():
+                        raise RuntimeError("Contextual enrichment cancelled")
+                    context, context_tokens = await self._generate_context(client, part, chunk["text"])
+                if context is None:
+                    context = FALLBACK_CONTEXT
+                else:
+                    contexts_cache[key] = context
+                    generated += 1
+
+            completed += 1
+            if show_progress and completed % 5 == 0:
+                print(f"    Processed {completed}/{len(base_chunks)} chunks...")
+            return context, context_tokens
+
+        async with self._create_client() as client:
+            results = await asyncio.gather(*(enrich(client, chunk) for chunk in base_chunks))
+        contexts = [context for context, _ in results]
+
+        if generated:
+            self._save_contexts()
+
+        # Step 3: Build enriched chunks in document order. Fresh contexts are
+        # counted by the API's usage report; only cached and fallback contexts
+        # are encoded (in one batch), and the enriched size is the sum of the
+        # parts instead of a second encode of every enriched text.
+        context_counts = [count for _, count in results]
+        uncounted = [i for i, count in enumerate(context_counts) if count is None]
+        if uncounted:
+            encoded = self.tokenizer.encode_ordinary_batch([contexts[i] for i in uncounted])
+            for i, ids in zip(uncounted, encoded):
+                context_counts[i] = len(ids)
 
+        enriched_chunks = []
+        for i, (chunk, context) in enumerate(zip(base_chunks, contexts)):
             enriched_chunks.append({
-                "text": enriched_text,
+                "text": f"{context}{CONTEXT_SEPARATOR}{chunk['text']}",
                 "original_text": chunk["text"],
                 "context": context,
                 "doc_id": doc_id,
                 "chunk_id": f"{doc_id}_chunk_{i}",
                 "start_token": chunk["start_token"],
                 "end_token": chunk["end_token"],
-                "num_tokens": len(self.tokenizer.encode(enriched_text)),
+                "num_tokens": chunk["num_tokens"] + self.separator_tokens + context_counts[i],
                 "num_tokens_original": chunk["num_tokens"],
-                "num_tokens_context": len(self.tokenizer.encode(context)),
+                "num_tokens_context": context_counts[i],
                 "method": "contextual",
                 "overlap_tokens": chunk["overlap_tokens"]
             })
@@ -107,18 +314,22 @@ class ContextualChunker:
 
         return enriched_chunks
 
-    def _create_base_chunks(self, text: str, doc_id: str) -> List[Dict]:
+    def _create_base_chunks(
+        self, text: str, doc_id: str, tokens: Optional[Sequence[int]] = None
+    ) -> List[Dict]:
         """
         Create base chunks using fixed-size chunking.
 
         Args:
             text: Text to chunk
             doc_id: Document identifier
+            tokens: Optional precomputed tokens of text
 
         Returns:
             List of base chunk dictionaries
         """
-        tokens = self.tokenizer.encode(text)
+        if tokens is None:
+            tokens = self.tokenizer.encode(text)
         chunks = []
         start = 0
 
@@ -143,59 +354,108 @@ class ContextualChunker:
 
         return chunks
 
-    def _generate_context(self, document: str, chunk: str) -> str:
+    def _uses_window(self, doc_tokens: int) -> bool:
+        """Whether requests carry a window around the chunk instead of the whole document."""
+        return (
+            not self.use_prompt_caching
+            and self.context_window > 0
+            and doc_tokens > self.chunk_size + 2 * self.context_window
+        )
+
+    def _window_text(self, tokens: Sequence[int], chunk: Dict) -> str:
         """
-        Generate chunk-specific context using LLM.
+        Decode the document tokens surrounding a base chunk.
+
+        Args:
+            tokens: Tokens of the full document
+            chunk: Base chunk with start_token/end_token
+
+        Returns:
+            Text of up to context_window tokens on each side of the chunk, plus the chunk
+        """
+        start = max(0, chunk["start_token"] - self.context_window)
+        end = min(len(tokens), chunk["end_token"] + self.context_window)
+        return self.tokenizer.decode(tokens[start:end])
+
+    def _document_part(self, document: str) -> Dict:
+        """
+        Build the message part holding the full document.
+
+        It is identical for every chunk of the document, so it goes first in
+        the prompt where providers can serve it from their prefix cache.
 
         Args:
             document: Full document text
-            chunk: Chunk text to generate context for
 
         Returns:
-            Generated context string
+            Text content part (marked with cache_control when caching is on)
         """
-        # Prepare the prompt
-        prompt = CONTEXT_INSTRUCTIONS_TEMPLATE.format(
-            document=document,
-            chunk=chunk
-        )
+        part = {"type": "text", "text": self._document_prefix + document + self._document_suffix}
+        if self.use_prompt_caching:
+            part["cache_control"] = {"type": "ephemeral"}
+        return part
+
+    async def _generate_context(
+        self, client: AsyncOpenAI, document_part: Dict, chunk: str
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Generate chunk-specific context using LLM.
 
+        Args:
+            client: Async client of the current run
+            document_part: Document message part from _document_part()
+            chunk: Chunk text to generate context for
+
+        Returns:
+            (context, completion tokens) - the count is None if the provider
+            reports no usage, and both are None if generation failed
+        """
         try:
-            # Call the LLM to generate context
-            response = self.client.chat.completions.create(
+            # Call the LLM to generate context; only the chunk part varies
+            response = await client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "user",
-                        "content": prompt
+                        "content": [
+                            document_part,
+                            {"type": "text", "text": self._chunk_prefix + chunk + self._chunk_suffix}
+                        ]
                     }
                 ],
                 max_tokens=200,  # Context should be concise (50-100 tokens)
                 temperature=0  # Deterministic
             )
 
-            # Extract the generated context
+            # Extract the generated context and the provider's token count
             context = response.choices[0].message.content.strip()
-            return context
+            usage = response.usage
+            return context, usage.completion_tokens if usage else None
 
         except Exception as e:
-            # If context generation fails, return a minimal context
+            # The caller substitutes a minimal context
             print(f"  Warning: Context generation failed: {e}")
-            return f"This chunk is from the document."
+            return None, None
 
-    def estimate_cost(self, text: str, num_chunks: Optional[int] = None) -> Dict[str, float]:
+    def estimate_cost(
+        self,
+        text: str,
+        num_chunks: Optional[int] = None,
+        tokens: Optional[Sequence[int]] = None
+    ) -> Dict[str, float]:
         """
         Estimate the cost of processing a document with contextual chunking.
 
         Args:
             text: Document text
             num_chunks: Number of chunks (if known), otherwise estimated
+            tokens: Optional precomputed tokens of text
 
         Returns:
             Dictionary with cost breakdown
         """
         # Count tokens in document
-        doc_tokens = len(self.tokenizer.encode(text))
+        doc_tokens = len(tokens) if tokens is not None else len(self.tokenizer.encode(text))
 
         # Estimate number of chunks
         if num_chunks is None:
@@ -204,11 +464,22 @@ class ContextualChunker:
         # Rough cost estimation (varies by provider)
         # Using typical pricing: ~$0.50 per million input tokens, ~$1.50 per million output tokens
         context_tokens = 100  # Average context length
-        instruction_tokens = 100  # Instruction template tokens
 
-        # Cost for each chunk (no caching in this simplified version)
-        input_per_chunk = doc_tokens + instruction_tokens
-        total_input = num_chunks * input_per_chunk * 0.50 / 1_000_000
+        # With caching, the first request writes the document prefix to the
+        # cache and the rest read it; the chunk itself is always full price
+        document_block = doc_tokens + self.document_template_tokens
+        if self.use_prompt_caching and num_chunks > 0:
+            doc_input = document_block * (
+                CACHE_WRITE_MULTIPLIER + (num_chunks - 1) * CACHE_READ_MULTIPLIER
+            )
+        elif self._uses_window(doc_tokens):
+            window_block = self.chunk_size + 2 * self.context_window + self.document_template_tokens
+            doc_input = num_chunks * window_block
+        else:
+            doc_input = num_chunks * document_block
+        chunk_input = num_chunks * (self.chunk_size + self.chunk_template_tokens)
+
+        total_input = (doc_input + chunk_input) * 0.50 / 1_000_000
         total_output = num_chunks * context_tokens * 1.50 / 1_000_000
         total_cost = total_input + total_output
 
@@ -218,5 +489,5 @@ class ContextualChunker:
             "document_tokens": doc_tokens,
             "input_cost_usd": round(total_input, 6),
             "output_cost_usd": round(total_output, 6),
-            "uses_caching": False
+            "uses_caching": self.use_prompt_caching
         }
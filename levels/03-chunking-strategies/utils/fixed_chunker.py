@@ -5,9 +5,9 @@ Add overlap between chunks (10-20%)
 Simple, fast, predictable
 """
 
-from typing import List, Dict
-import tiktoken
-from .config import CHUNK_SIZE, CHUNK_OVERLAP
+from typing import List, Dict, Optional, Sequence, Tuple
+from .config import CHUNK_SIZE, CHUNK_OVERLAP, get_encoder
+from .parallel import chunk_many
 
 
 class FixedChunker:
@@ -30,25 +30,52 @@ class FixedChunker:
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.tokenizer = get_encoder()
 
         # Validate overlap is reasonable (10-20% of chunk size)
         if self.chunk_overlap > self.chunk_size * 0.2:
             print(f"Warning: Overlap ({self.chunk_overlap}) is >20% of chunk size ({self.chunk_size})")
 
-    def chunk(self, text: str, doc_id: str) -> List[Dict]:
+    def __getstate__(self) -> Dict:
+        """Pickle only the settings; the tokenizer is re-acquired on unpickling."""
+        state = self.__dict__.copy()
+        del state["tokenizer"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.tokenizer = get_encoder()
+
+    def chunk_many(
+        self, docs: Sequence[Tuple[str, str]], workers: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Chunk many documents in parallel worker processes.
+
+        Args:
+            docs: (doc_id, text) pairs
+            workers: Worker processes (defaults to the CPU count)
+
+        Returns:
+            One chunk list per document, in input order
+        """
+        return chunk_many(self, docs, workers)
+
+    def chunk(self, text: str, doc_id: str, tokens: Optional[Sequence[int]] = None) -> List[Dict]:
         """
         Split text into fixed-size chunks with overlap.
 
         Args:
             text: Text to chunk
             doc_id: Document identifier
+            tokens: Optional precomputed tokens of text (e.g. from encode_document())
 
         Returns:
             List of chunk dictionaries with metadata
         """
-        # Tokenize the text
-        tokens = self.tokenizer.encode(text)
+        # Tokenize the text unless the caller already did
+        if tokens is None:
+            tokens = self.tokenizer.encode(text)
 
         chunks = []
         start = 0
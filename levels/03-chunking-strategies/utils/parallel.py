@@ -0,0 +1,45 @@
+"""Process-pool fan-out for chunking many documents.
+
+Fixed and semantic chunking are pure CPU work per document, so threads would
+serialize on the GIL. Each document is chunked in a worker process instead;
+chunkers pickle only their settings and re-acquire the tokenizer there.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def _chunk_one(args: Tuple[Any, str, str]) -> List[Dict]:
+    """Chunk one document in a worker process."""
+    chunker, text, doc_id = args
+    return chunker.chunk(text, doc_id)
+
+
+def chunk_many(
+    chunker: Any,
+    docs: Sequence[Tuple[str, str]],
+    workers: Optional[int] = None
+) -> List[List[Dict]]:
+    """
+    Chunk independent documents in parallel.
+
+    Args:
+        chunker: Picklable chunker with a chunk(text, doc_id) method
+        docs: (doc_id, text) pairs
+        workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        One chunk list per document, in input order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(docs))
+
+    # Starting processes costs more than chunking a single document
+    if workers <= 1:
+        return [chunker.chunk(text, doc_id) for doc_id, text in docs]
+
+    jobs = [(chunker, text, doc_id) for doc_id, text in docs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Batch documents per task so small ones don't pay a round trip each
+        chunksize = max(1, len(jobs) // (workers * 4))
+        return list(pool.map(_chunk_one, jobs, chunksize=chunksize))
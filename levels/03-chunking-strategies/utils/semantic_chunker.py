@@ -5,27 +5,82 @@ Add overlap for context preservation
 Respects document structure
 """
 
-import sys
-from pathlib import Path
-from typing import List, Dict
-import nltk
-from nltk.tokenize import sent_tokenize
-import tiktoken
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Sequence, Tuple
 
-# Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from .config import CHUNK_SIZE, CHUNK_OVERLAP
-
-# Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+    import blingfire
+    BLINGFIRE_AVAILABLE = True
+except ImportError:
+    BLINGFIRE_AVAILABLE = False
+
 try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab', quiet=True)
+    import pysbd
+    PYSBD_AVAILABLE = True
+except ImportError:
+    PYSBD_AVAILABLE = False
+
+from .config import CHUNK_SIZE, CHUNK_OVERLAP, SENTENCE_SPLITTER, get_encoder
+from .parallel import chunk_many
+
+
+def _blingfire_sentences(text: str) -> List[str]:
+    """Split sentences with BlingFire (compiled state machine, fastest)."""
+    return [s for s in blingfire.text_to_sentences(text).split("\n") if s]
+
+
+@lru_cache(maxsize=1)
+def _pysbd_segmenter() -> "pysbd.Segmenter":
+    """Build the pySBD segmenter once per process."""
+    return pysbd.Segmenter(language="en", clean=False)
+
+
+def _pysbd_sentences(text: str) -> List[str]:
+    """Split sentences with pySBD (rule-based, handles abbreviations well)."""
+    return [s.strip() for s in _pysbd_segmenter().segment(text) if s.strip()]
+
+
+@lru_cache(maxsize=1)
+def _ensure_punkt() -> None:
+    """Download the NLTK Punkt models on first use (not at import)."""
+    import nltk
+
+    for resource in ("punkt", "punkt_tab"):
+        try:
+            nltk.data.find(f"tokenizers/{resource}")
+        except LookupError:
+            nltk.download(resource, quiet=True)
+
+
+def _nltk_sentences(text: str) -> List[str]:
+    """Split sentences with NLTK Punkt (pure Python, always installed)."""
+    _ensure_punkt()
+    from nltk.tokenize import sent_tokenize
+
+    return sent_tokenize(text)
+
+
+def get_sentence_splitter(name: str = SENTENCE_SPLITTER) -> Callable[[str], List[str]]:
+    """
+    Resolve a sentence splitter by name.
+
+    Args:
+        name: "blingfire", "pysbd", "nltk", or "auto" for the fastest installed
+
+    Returns:
+        Function mapping text to a list of sentences
+    """
+    if name == "auto":
+        name = "blingfire" if BLINGFIRE_AVAILABLE else "pysbd" if PYSBD_AVAILABLE else "nltk"
+
+    if name == "blingfire" and BLINGFIRE_AVAILABLE:
+        return _blingfire_sentences
+    if name == "pysbd" and PYSBD_AVAILABLE:
+        return _pysbd_sentences
+    if name in ("blingfire", "pysbd", "nltk"):
+        # A requested splitter that isn't installed falls back to NLTK
+        return _nltk_sentences
+    raise ValueError(f"Unknown sentence splitter: {name}")
 
 
 class SemanticChunker:
@@ -38,17 +93,49 @@ class SemanticChunker:
     - Respects document structure
     """
 
-    def __init__(self, chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP):
+    def __init__(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        chunk_overlap: int = CHUNK_OVERLAP,
+        sentence_splitter: str = SENTENCE_SPLITTER
+    ):
         """
         Initialize the semantic chunker.
 
         Args:
             chunk_size: Target size of each chunk in tokens (soft limit)
             chunk_overlap: Number of tokens to overlap between chunks
+            sentence_splitter: "blingfire", "pysbd", "nltk" or "auto" (see config)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.split_sentences = get_sentence_splitter(sentence_splitter)
+        self.tokenizer = get_encoder()
+
+    def __getstate__(self) -> Dict:
+        """Pickle only the settings; the tokenizer is re-acquired on unpickling."""
+        state = self.__dict__.copy()
+        del state["tokenizer"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.tokenizer = get_encoder()
+
+    def chunk_many(
+        self, docs: Sequence[Tuple[str, str]], workers: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Chunk many documents in parallel worker processes.
+
+        Args:
+            docs: (doc_id, text) pairs
+            workers: Worker processes (defaults to the CPU count)
+
+        Returns:
+            One chunk list per document, in input order
+        """
+        return chunk_many(self, docs, workers)
 
     def chunk(self, text: str, doc_id: str) -> List[Dict]:
         """
@@ -71,70 +158,77 @@ class SemanticChunker:
         if not paragraphs:
             return []
 
+        # Count every paragraph's tokens in one batch call
+        para_token_counts = [len(ids) for ids in self.tokenizer.encode_ordinary_batch(paragraphs)]
+
         chunks = []
-        current_chunk_text = ""
+        # Pieces of the chunk being built, each carrying its leading separator;
+        # joined once when the chunk is emitted (no quadratic re-copying)
+        current_parts: List[str] = []
         current_chunk_tokens = 0
-        overlap_buffer = []  # Store recent sentences for overlap
+        # Recent (sentence, token count) pairs for overlap; the count is None
+        # until needed for sentences of paragraphs that were added whole
+        overlap_buffer: List[Tuple[str, Optional[int]]] = []
 
-        for para in paragraphs:
-            para_tokens = len(self.tokenizer.encode(para))
+        for para, para_tokens in zip(paragraphs, para_token_counts):
 
             # If paragraph is too large, split it by sentences
             if para_tokens > self.chunk_size:
-                sentences = sent_tokenize(para)
+                sentences = self.split_sentences(para)
+                sentence_counts = [len(ids) for ids in self.tokenizer.encode_ordinary_batch(sentences)]
 
-                for sentence in sentences:
-                    sent_tokens = len(self.tokenizer.encode(sentence))
+                for sentence, sent_tokens in zip(sentences, sentence_counts):
 
                     # If adding this sentence exceeds chunk size, create a chunk
-                    if current_chunk_tokens + sent_tokens > self.chunk_size and current_chunk_text:
+                    if current_chunk_tokens + sent_tokens > self.chunk_size and current_parts:
                         # Create chunk
                         chunks.append(self._create_chunk(
-                            current_chunk_text.strip(),
+                            "".join(current_parts).strip(),
                             doc_id,
                             len(chunks),
                             current_chunk_tokens
                         ))
 
                         # Start new chunk with overlap from previous chunk
-                        current_chunk_text = self._get_overlap_text(overlap_buffer)
-                        current_chunk_tokens = len(self.tokenizer.encode(current_chunk_text))
+                        overlap_text, current_chunk_tokens = self._get_overlap_text(overlap_buffer)
+                        current_parts = [overlap_text] if overlap_text else []
                         overlap_buffer = []
 
                     # Add sentence to current chunk
-                    current_chunk_text += (" " if current_chunk_text else "") + sentence
+                    current_parts.append(" " + sentence if current_parts else sentence)
                     current_chunk_tokens += sent_tokens
-                    overlap_buffer.append(sentence)
+                    overlap_buffer.append((sentence, sent_tokens))
 
             else:
                 # Paragraph fits within chunk size
                 # If adding this paragraph exceeds chunk size, create a chunk
-                if current_chunk_tokens + para_tokens > self.chunk_size and current_chunk_text:
+                if current_chunk_tokens + para_tokens > self.chunk_size and current_parts:
                     # Create chunk
                     chunks.append(self._create_chunk(
-                        current_chunk_text.strip(),
+                        "".join(current_parts).strip(),
                         doc_id,
                         len(chunks),
                         current_chunk_tokens
                     ))
 
                     # Start new chunk with overlap from previous chunk
-                    current_chunk_text = self._get_overlap_text(overlap_buffer)
-                    current_chunk_tokens = len(self.tokenizer.encode(current_chunk_text))
+                    overlap_text, current_chunk_tokens = self._get_overlap_text(overlap_buffer)
+                    current_parts = [overlap_text] if overlap_text else []
                     overlap_buffer = []
 
                 # Add paragraph to current chunk
-                current_chunk_text += ("\n\n" if current_chunk_text else "") + para
+                current_parts.append("\n\n" + para if current_parts else para)
                 current_chunk_tokens += para_tokens
 
                 # Split paragraph into sentences for overlap buffer
-                para_sentences = sent_tokenize(para)
-                overlap_buffer.extend(para_sentences)
+                para_sentences = self.split_sentences(para)
+                overlap_buffer.extend((sentence, None) for sentence in para_sentences)
 
         # Add final chunk if there's remaining text
-        if current_chunk_text.strip():
+        current_chunk_text = "".join(current_parts).strip()
+        if current_chunk_text:
             chunks.append(self._create_chunk(
-                current_chunk_text.strip(),
+                current_chunk_text,
                 doc_id,
                 len(chunks),
                 current_chunk_tokens
@@ -142,33 +236,37 @@ class SemanticChunker:
 
         return chunks
 
-    def _get_overlap_text(self, sentence_buffer: List[str]) -> str:
+    def _get_overlap_text(self, sentence_buffer: List[Tuple[str, Optional[int]]]) -> Tuple[str, int]:
         """
         Get overlap text from recent sentences to prepend to next chunk.
 
+        Token counts already known from the main loop are reused; only
+        sentences that were never counted are encoded.
+
         Args:
-            sentence_buffer: List of recent sentences
+            sentence_buffer: List of recent (sentence, token count or None) pairs
 
         Returns:
-            Overlap text (up to chunk_overlap tokens)
+            Tuple of (overlap text up to chunk_overlap tokens, its token count)
         """
         if not sentence_buffer:
-            return ""
+            return "", 0
 
         # Take sentences from the end until we reach overlap token limit
-        overlap_text = ""
+        overlap_sentences = []
         overlap_tokens = 0
 
-        for sentence in reversed(sentence_buffer):
-            sent_tokens = len(self.tokenizer.encode(sentence))
+        for sentence, sent_tokens in reversed(sentence_buffer):
+            if sent_tokens is None:
+                sent_tokens = len(self.tokenizer.encode(sentence))
 
             if overlap_tokens + sent_tokens <= self.chunk_overlap:
-                overlap_text = sentence + " " + overlap_text
+                overlap_sentences.append(sentence)
                 overlap_tokens += sent_tokens
             else:
                 break
 
-        return overlap_text.strip()
+        return " ".join(reversed(overlap_sentences)).strip(), overlap_tokens
 
     def _create_chunk(self, text: str, doc_id: str, chunk_idx: int, num_tokens: int) -> Dict:
         """
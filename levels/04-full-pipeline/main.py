@@ -15,7 +15,7 @@ from typing import List, Dict
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared import Config
+from shared import Config, read_text_files
 from utils import (
     PDFExtractor,
     TextChunker,
@@ -122,7 +122,7 @@ class FullPipeline:
             else:
                 # Load chunks
                 chunk_files = sorted(doc_dir.glob("chunk_*.txt"))
-                chunks = [f.read_text() for f in chunk_files]
+                chunks = read_text_files(chunk_files)
 
                 # Generate embeddings
                 embeddings_data = self.embedding_manager.embed_chunks(chunks, show_progress=True)
@@ -132,8 +132,9 @@ class FullPipeline:
                 self.embedding_manager.save_embeddings(embeddings_data, doc_dir)
                 print_success(f"Saved embeddings to {embeddings_file}")
 
-            # Add to search engine
-            self.search_engine.add_document(doc_name, embeddings_data)
+            # Add to search engine (memory-mapped float16 matrix when available)
+            matrix = self.embedding_manager.load_embedding_matrix(doc_dir, len(embeddings_data))
+            self.search_engine.add_document(doc_name, embeddings_data, matrix)
 
         # Build search index
         self.search_engine.build_index()
@@ -188,8 +189,8 @@ class FullPipeline:
             query: Search query
             results: List of search results
         """
-        import json
         from datetime import datetime
+        from shared.io import dumps_json
 
         results_file = self.output_dir / "search_history.jsonl"
 
@@ -200,8 +201,8 @@ class FullPipeline:
         }
 
         # Append to JSONL file
-        with results_file.open('a') as f:
-            f.write(json.dumps(result_entry) + '\n')
+        with results_file.open('ab') as f:
+            f.write(dumps_json(result_entry, indent=False) + b'\n')
 
     def run(self) -> None:
         """Execute the full pipeline."""
@@ -5,16 +5,24 @@ Handles creation and persistence of embeddings with smart caching to avoid
 redundant API calls.
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 import json
 import hashlib
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional
+import numpy as np
 
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from shared import Embedder as SharedEmbedder, Config
+from shared.retrieval import normalize_embeddings
+from shared.io import dumps_json, loads_json
+
+# Unit-normalized float16 copy of a document's embeddings, memory-mapped at search time
+MATRIX_FILENAME = "embeddings.f16.npy"
 
 
 class EmbeddingManager:
@@ -37,14 +45,14 @@ class EmbeddingManager:
         """Load the embedding cache from disk."""
         if self.cache_file.exists():
             try:
-                return json.loads(self.cache_file.read_text())
+                return loads_json(self.cache_file.read_bytes())
             except json.JSONDecodeError:
                 return {}
         return {}
 
     def _save_cache(self) -> None:
         """Save the embedding cache to disk."""
-        self.cache_file.write_text(json.dumps(self.cache, indent=2))
+        self.cache_file.write_bytes(dumps_json(self.cache))
 
     def _compute_hash(self, text: str) -> str:
         """
@@ -72,14 +80,13 @@ class EmbeddingManager:
 
     def _cache_embedding(self, text_hash: str, embedding: List[float]) -> None:
         """
-        Cache an embedding.
+        Cache an embedding in memory (call _save_cache to persist).
 
         Args:
             text_hash: Hash of the text content
             embedding: Embedding vector to cache
         """
         self.cache[text_hash] = embedding
-        self._save_cache()
 
     def embed_chunks(self, chunks: List[str], show_progress: bool = True) -> List[Dict]:
         """
@@ -92,40 +99,34 @@ class EmbeddingManager:
         Returns:
             List of dictionaries with chunk text, hash, and embedding
         """
-        results = []
-        new_embeddings_count = 0
-        cached_count = 0
-
-        for idx, chunk in enumerate(chunks, 1):
-            text_hash = self._compute_hash(chunk)
-
-            # Check cache
-            cached_embedding = self._get_cached_embedding(text_hash)
-
-            if cached_embedding is not None:
-                embedding = cached_embedding
-                cached_count += 1
-            else:
-                # Generate new embedding
-                embedding = self.embedder.embed_query(chunk)
-                # Convert to list if it's a numpy array
-                if hasattr(embedding, 'tolist'):
-                    embedding = embedding.tolist()
-                self._cache_embedding(text_hash, embedding)
-                new_embeddings_count += 1
+        text_hashes = [self._compute_hash(chunk) for chunk in chunks]
+
+        # Collect cache misses so they can be embedded in batched requests
+        uncached = {}
+        for chunk, text_hash in zip(chunks, text_hashes):
+            if self._get_cached_embedding(text_hash) is None and text_hash not in uncached:
+                uncached[text_hash] = chunk
+
+        if uncached:
+            if show_progress:
+                print(f"  Embedding {len(uncached)} uncached chunks...")
+            new_embeddings = self.embedder.embed(list(uncached.values()))
+            for text_hash, embedding in zip(uncached.keys(), new_embeddings):
+                self._cache_embedding(text_hash, embedding.tolist())
+            self._save_cache()
 
+        results = []
+        for idx, (chunk, text_hash) in enumerate(zip(chunks, text_hashes), 1):
             results.append({
                 "chunk_id": idx,
                 "text": chunk,
                 "text_hash": text_hash,
-                "embedding": embedding
+                "embedding": self._get_cached_embedding(text_hash)
             })
 
-            if show_progress and idx % 10 == 0:
-                print(f"  Processed {idx}/{len(chunks)} chunks...")
-
         if show_progress:
-            print(f"  Generated {new_embeddings_count} new embeddings, used {cached_count} cached")
+            cached_count = len(chunks) - len(uncached)
+            print(f"  Generated {len(uncached)} new embeddings, used {cached_count} cached")
 
         return results
 
@@ -151,9 +152,41 @@ class EmbeddingManager:
             "embeddings": embeddings_data
         }
 
-        embeddings_file.write_text(json.dumps(data, indent=2))
+        # Search only needs unit vectors; float16 halves the bytes scanned per
+        # query. The matrix is written before embeddings.json, whose presence
+        # marks the document as embedded, so an interrupted save never pairs
+        # a new embeddings.json with an old matrix
+        if embeddings_data:
+            matrix = normalize_embeddings([item["embedding"] for item in embeddings_data])
+            matrix = matrix.astype(np.float16)
+            self._write_atomic(output_dir / MATRIX_FILENAME, lambda f: np.save(f, matrix))
+
+        payload = dumps_json(data)
+        self._write_atomic(embeddings_file, lambda f: f.write(payload))
+
         return embeddings_file
 
+    @staticmethod
+    def _write_atomic(path: Path, write: Callable[[Any], None]) -> None:
+        """
+        Write a file atomically (temp file in the same directory, then rename).
+
+        Readers never see a half-written file, and a memory map of the old
+        file stays valid because the rename swaps in a new inode.
+
+        Args:
+            path: Destination file
+            write: Function writing the contents to a binary file object
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=path.suffix + ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def load_embeddings(self, embeddings_file: Path) -> List[Dict]:
         """
         Load embeddings from disk.
@@ -167,9 +200,35 @@ class EmbeddingManager:
         if not embeddings_file.exists():
             return []
 
-        data = json.loads(embeddings_file.read_text())
+        data = loads_json(embeddings_file.read_bytes())
         return data.get("embeddings", [])
 
+    def load_embedding_matrix(self, doc_dir: Path, expected_rows: int) -> Optional[np.ndarray]:
+        """
+        Memory-map a document's normalized float16 embedding matrix.
+
+        Args:
+            doc_dir: Document output directory
+            expected_rows: Number of chunks the matrix must cover
+
+        Returns:
+            Read-only memmap of shape (n_chunks, dim), or None if the file is
+            missing or out of sync with embeddings.json
+        """
+        matrix_file = doc_dir / MATRIX_FILENAME
+        if not matrix_file.exists():
+            return None
+
+        try:
+            matrix = np.load(matrix_file, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        if matrix.ndim != 2 or matrix.shape[0] != expected_rows:
+            return None
+
+        return matrix
+
     def get_embedding_dimension(self) -> int:
         """Get the dimension of the embeddings."""
         return self.embedder.get_embedding_dimension()
@@ -4,10 +4,37 @@ Semantic search functionality using vector similarity.
 Implements cosine similarity search over embedded document chunks.
 """
 
+import os
+import sys
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
+# Add shared module to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.retrieval import normalize_embeddings, top_k_dot, top_k_indices
+
+try:
+    import faiss
+except ImportError:  # Optional GPU backend; CPU scan is used without it
+    faiss = None
+
+# Rows scored per matmul; keeps the float32 upcast of float16 blocks small
+TILE_ROWS = 65536
+
+# Below this many chunks, host<->device transfers outweigh any GPU speedup
+GPU_MIN_ROWS = int(os.getenv("GPU_SEARCH_MIN_ROWS", "200000"))
+
+
+def _gpu_search_available() -> bool:
+    """Check for a FAISS build with GPU support and a visible CUDA device."""
+    if faiss is None or not hasattr(faiss, "StandardGpuResources"):
+        return False
+    if os.getenv("CUDA_VISIBLE_DEVICES", "") in ("", "-1"):
+        return False
+    return faiss.get_num_gpus() > 0
+
 
 class SemanticSearchEngine:
     """Perform semantic search over document embeddings."""
@@ -15,25 +42,51 @@ class SemanticSearchEngine:
     def __init__(self):
         """Initialize the search engine."""
         self.embeddings_data = []
-        self.embedding_vectors = None
-
-    def index_embeddings(self, embeddings_data: List[Dict]) -> None:
+        self.embedding_blocks = []
+        self.gpu_index = None
+
+    def index_embeddings(
+        self,
+        embeddings_data: List[Dict],
+        matrices: Optional[List[np.ndarray]] = None,
+    ) -> None:
         """
         Index embeddings for search.
 
         Args:
             embeddings_data: List of embedding dictionaries with 'embedding' and metadata
+            matrices: Optional pre-normalized matrices (e.g. float16 memmaps)
+                whose stacked rows line up with embeddings_data
         """
         self.embeddings_data = embeddings_data
 
-        # Convert to numpy array for efficient computation
-        self.embedding_vectors = np.array([
-            item['embedding'] for item in embeddings_data
-        ])
-
-        # Normalize vectors for cosine similarity
-        norms = np.linalg.norm(self.embedding_vectors, axis=1, keepdims=True)
-        self.embedding_vectors = self.embedding_vectors / norms
+        if matrices is not None:
+            # Keep the (possibly memory-mapped) blocks as-is; pages load on demand
+            self.embedding_blocks = list(matrices)
+        else:
+            # Normalize once into a contiguous float32 matrix so each query is a
+            # single matrix-vector product
+            self.embedding_blocks = [normalize_embeddings([
+                item['embedding'] for item in embeddings_data
+            ])]
+
+        self.gpu_index = None
+        if len(embeddings_data) >= GPU_MIN_ROWS and _gpu_search_available():
+            self.gpu_index = self._build_gpu_index()
+
+    def _build_gpu_index(self):
+        """Copy the normalized matrix to GPU memory once as an exact inner-product index."""
+        dim = self.embedding_blocks[0].shape[1]
+        index = faiss.index_cpu_to_gpu(
+            faiss.StandardGpuResources(), 0, faiss.IndexFlatIP(dim)
+        )
+
+        for block in self.embedding_blocks:
+            for start in range(0, len(block), TILE_ROWS):
+                tile = block[start:start + TILE_ROWS]
+                index.add(np.ascontiguousarray(tile, dtype=np.float32))
+
+        return index
 
     def cosine_similarity(self, query_vector: List[float]) -> np.ndarray:
         """
@@ -45,17 +98,20 @@ class SemanticSearchEngine:
         Returns:
             Array of similarity scores
         """
-        if self.embedding_vectors is None:
+        if not self.embedding_blocks:
             raise ValueError("No embeddings indexed. Call index_embeddings first.")
 
         # Normalize query vector
-        query_array = np.array(query_vector)
-        query_norm = query_array / np.linalg.norm(query_array)
+        query_norm = normalize_embeddings(query_vector)
 
-        # Compute dot product (cosine similarity for normalized vectors)
-        similarities = np.dot(self.embedding_vectors, query_norm)
+        # Dot product (cosine similarity for normalized vectors), tile by tile
+        similarities = [
+            np.dot(block[start:start + TILE_ROWS].astype(np.float32, copy=False), query_norm)
+            for block in self.embedding_blocks
+            for start in range(0, len(block), TILE_ROWS)
+        ]
 
-        return similarities
+        return np.concatenate(similarities)
 
     def search(self, query_embedding: List[float], top_k: int = 5) -> List[Dict]:
         """
@@ -71,19 +127,15 @@ class SemanticSearchEngine:
         if not self.embeddings_data:
             return []
 
-        # Compute similarities
-        similarities = self.cosine_similarity(query_embedding)
-
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        top_indices, top_scores = self._top_k(query_embedding, top_k)
 
         # Prepare results
         results = []
-        for rank, idx in enumerate(top_indices, 1):
+        for rank, (idx, score) in enumerate(zip(top_indices, top_scores), 1):
             result = {
                 "rank": rank,
                 "chunk_id": self.embeddings_data[idx].get("chunk_id", idx + 1),
-                "score": float(similarities[idx]),
+                "score": float(score),
                 "text": self.embeddings_data[idx].get("text", ""),
                 "text_hash": self.embeddings_data[idx].get("text_hash", "")
             }
@@ -91,6 +143,46 @@ class SemanticSearchEngine:
 
         return results
 
+    def _top_k(self, query_vector: List[float], top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the top-k chunks without materializing every similarity score.
+
+        Large indexes on a CUDA machine with faiss-gpu are searched on the
+        GPU. Otherwise each tile yields its own top-k candidates (fused dot
+        product + top-k when Numba is installed), merged at the end.
+
+        Args:
+            query_vector: Query embedding vector
+            top_k: Number of results to return
+
+        Returns:
+            Tuple of (chunk indices, similarity scores), highest score first
+        """
+        if not self.embedding_blocks:
+            raise ValueError("No embeddings indexed. Call index_embeddings first.")
+
+        query_norm = normalize_embeddings(query_vector)
+
+        if self.gpu_index is not None:
+            scores, rows = self.gpu_index.search(query_norm[None, :], top_k)
+            found = rows[0] >= 0
+            return rows[0][found], scores[0][found]
+
+        candidate_rows, candidate_scores = [], []
+        offset = 0
+        for block in self.embedding_blocks:
+            for start in range(0, len(block), TILE_ROWS):
+                tile = block[start:start + TILE_ROWS].astype(np.float32, copy=False)
+                rows, scores = top_k_dot(tile, query_norm, top_k)
+                candidate_rows.append(rows + offset + start)
+                candidate_scores.append(scores)
+            offset += len(block)
+
+        rows = np.concatenate(candidate_rows)
+        scores = np.concatenate(candidate_scores)
+        best = top_k_indices(scores, top_k)
+        return rows[best], scores[best]
+
     def get_stats(self) -> Dict:
         """
         Get statistics about the indexed embeddings.
@@ -101,7 +193,8 @@ class SemanticSearchEngine:
         return {
             "total_chunks": len(self.embeddings_data),
             "embedding_dimension": len(self.embeddings_data[0]["embedding"]) if self.embeddings_data else 0,
-            "indexed": self.embedding_vectors is not None
+            "indexed": bool(self.embedding_blocks),
+            "gpu": self.gpu_index is not None
         }
 
 
@@ -112,15 +205,22 @@ class MultiDocumentSearchEngine:
         """Initialize multi-document search engine."""
         self.documents = {}
         self.all_embeddings = []
+        self.matrices = []
         self.search_engine = SemanticSearchEngine()
 
-    def add_document(self, doc_name: str, embeddings_data: List[Dict]) -> None:
+    def add_document(
+        self,
+        doc_name: str,
+        embeddings_data: List[Dict],
+        matrix: Optional[np.ndarray] = None,
+    ) -> None:
         """
         Add a document's embeddings to the index.
 
         Args:
             doc_name: Name of the document
             embeddings_data: List of embedding dictionaries
+            matrix: Optional pre-normalized embedding matrix for the document
         """
         # Add document name to each embedding
         for item in embeddings_data:
@@ -128,13 +228,18 @@ class MultiDocumentSearchEngine:
 
         self.documents[doc_name] = len(embeddings_data)
         self.all_embeddings.extend(embeddings_data)
+        self.matrices.append(matrix)
 
     def build_index(self) -> None:
         """Build the search index from all added documents."""
         if not self.all_embeddings:
             raise ValueError("No documents added. Use add_document first.")
 
-        self.search_engine.index_embeddings(self.all_embeddings)
+        # Use the stored matrices only if every document has one
+        if all(matrix is not None for matrix in self.matrices):
+            self.search_engine.index_embeddings(self.all_embeddings, self.matrices)
+        else:
+            self.search_engine.index_embeddings(self.all_embeddings)
 
     def search(self, query_embedding: List[float], top_k: int = 5) -> List[Dict]:
         """
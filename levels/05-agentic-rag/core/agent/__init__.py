@@ -4,9 +4,10 @@ Agent Module - Core agent orchestration.
 Exports:
     run_agent_loop: Main agent loop function
     execute_tool_call: Tool execution function
+    execute_tool_calls: Concurrent execution of one turn's tool calls
 """
 
 from .loop import run_agent_loop
-from .executor import execute_tool_call
+from .executor import execute_tool_call, execute_tool_calls
 
-__all__ = ['run_agent_loop', 'execute_tool_call']
+__all__ = ['run_agent_loop', 'execute_tool_call', 'execute_tool_calls']
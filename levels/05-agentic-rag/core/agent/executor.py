@@ -8,19 +8,41 @@ This module is responsible for:
 4. Formatting results
 """
 
-import json
-from typing import Dict, Any
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Sequence
 
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from shared.io import dumps_json, loads_json
 from core.tool_system import registry
 from interface.ui import print_tool_call, print_tool_result, print_tool_error
 
+_NUMBER_ENDINGS = frozenset("0123456789.")
+
+# Tools are I/O-bound (embedding API, Qdrant), so parallel tool calls from one
+# assistant turn run on threads and their round trips overlap
+MAX_PARALLEL_TOOL_CALLS = 8
+_tool_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOL_CALLS, thread_name_prefix="tool")
+
+# Held while one call's display block is printed
+_display_lock = threading.Lock()
+
+# Longest document content (in characters) sent back to the LLM per search
+# hit; every tool result stays in the history and is re-sent on each turn
+MAX_RESULT_CONTENT_CHARS = 12000
+
 
 def convert_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert string numbers to appropriate numeric types.
 
     The LLM sometimes returns numbers as strings. This function
-    converts them to float/int for proper tool execution.
+    converts them to int (no '.' or exponent) or float for proper tool
+    execution; anything the parsers reject stays a string.
 
     Args:
         arguments: Raw arguments from the LLM
@@ -30,21 +52,77 @@ def convert_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     converted = {}
     for key, value in arguments.items():
-        if isinstance(value, str):
-            # Try to convert numeric strings to float
-            if value.replace('.', '', 1).replace('-', '', 1).isdigit():
-                converted[key] = float(value)
-            else:
+        # Numbers end in a digit or '.', which also keeps words such as
+        # "nan" or "infinity" from being parsed as floats
+        if isinstance(value, str) and value[-1:] in _NUMBER_ENDINGS:
+            try:
+                if '.' in value or 'e' in value or 'E' in value:
+                    converted[key] = float(value)
+                else:
+                    converted[key] = int(value)
+            except ValueError:
                 converted[key] = value
         else:
             converted[key] = value
     return converted
 
 
+def _trim_content(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cap the 'content' of each search hit in a tool result.
+
+    Args:
+        result: Tool result dictionary (not modified)
+
+    Returns:
+        The same result, or a copy with long contents truncated
+    """
+    hits = result.get("results")
+    if not isinstance(hits, list) or not any(
+        isinstance(hit, dict) and len(hit.get("content") or "") > MAX_RESULT_CONTENT_CHARS
+        for hit in hits
+    ):
+        return result
+
+    trimmed = []
+    for hit in hits:
+        content = hit.get("content") if isinstance(hit, dict) else None
+        if isinstance(content, str) and len(content) > MAX_RESULT_CONTENT_CHARS:
+            hit = {**hit, "content": content[:MAX_RESULT_CONTENT_CHARS] + "... [truncated]"}
+        trimmed.append(hit)
+    return {**result, "results": trimmed}
+
+
+def format_result(result: Any) -> str:
+    """
+    Serialize a tool result for the conversation history.
+
+    Dicts and lists become compact JSON, which the model parses more
+    reliably than Python's repr and which is cheaper to produce.
+
+    Args:
+        result: Value returned by a tool
+
+    Returns:
+        Message content for the tool result
+    """
+    if isinstance(result, dict):
+        result = _trim_content(result)
+    if isinstance(result, (dict, list)):
+        try:
+            return dumps_json(result, indent=False).decode()
+        except TypeError:
+            pass  # Not JSON-serializable; fall back to repr
+    return str(result)
+
+
 def execute_tool_call(tool_call) -> str:
     """
     Execute a single tool call and return the result.
 
+    The call, its result and any error are displayed together once the
+    tool returns, so concurrent calls never interleave their output.
+
     Args:
         tool_call: The tool call object from OpenAI
 
@@ -52,29 +130,50 @@ def execute_tool_call(tool_call) -> str:
         String representation of the result or error message
     """
     function_name = tool_call.function.name
-    arguments = json.loads(tool_call.function.arguments)
-
-    # Display the tool call
-    print_tool_call(function_name, arguments)
+    arguments = loads_json(tool_call.function.arguments)
 
+    error_msg = None
     try:
         # Get the tool function
         tool_function = registry.get_tool(function_name)
 
         if not tool_function:
             error_msg = f"Tool '{function_name}' not found"
-            print_tool_error(error_msg)
-            return error_msg
-
-        # Convert arguments and execute
-        converted_args = convert_arguments(arguments)
-        result = tool_function(**converted_args)
-
-        # Display result
-        print_tool_result(result)
-        return str(result)
+        else:
+            # Convert arguments and execute
+            converted_args = convert_arguments(arguments)
+            result = tool_function(**converted_args)
 
     except Exception as e:
         error_msg = f"{type(e).__name__}: {e}"
-        print_tool_error(error_msg)
+
+    # Display the tool call with its outcome as one block
+    with _display_lock:
+        print_tool_call(function_name, arguments)
+        if error_msg is not None:
+            print_tool_error(error_msg)
+        else:
+            print_tool_result(result)
+
+    if error_msg is not None:
         return error_msg
+    return format_result(result)
+
+
+def execute_tool_calls(tool_calls: Sequence) -> List[str]:
+    """
+    Execute the tool calls of one assistant turn concurrently.
+
+    Each call is displayed (call, then result or error) under a shared
+    lock after it finishes, so blocks appear in completion order but never
+    interleave.
+
+    Args:
+        tool_calls: Tool call objects from OpenAI
+
+    Returns:
+        Results in the same order as tool_calls
+    """
+    if len(tool_calls) <= 1:
+        return [execute_tool_call(tool_call) for tool_call in tool_calls]
+    return list(_tool_pool.map(execute_tool_call, tool_calls))
@@ -12,7 +12,7 @@ from typing import List, Dict, Any
 from openai import OpenAI
 
 from core.tool_system import registry
-from core.agent.executor import execute_tool_call
+from core.agent.executor import execute_tool_calls
 from interface.ui import print_thinking, print_assistant_message, print_error, print_separator
 
 
@@ -116,27 +116,25 @@ def run_agent_loop(
                     ]
                 })
 
-                # Execute each tool call and add results
-                for tc in collected_tool_calls:
-                    # Create tool call object
-                    class ToolCall:
-                        def __init__(self, id, function_name, arguments):
-                            self.id = id
-                            self.function = type('obj', (object,), {
-                                'name': function_name,
-                                'arguments': arguments
-                            })()
-
-                    tool_call_obj = ToolCall(
-                        tc["id"],
-                        tc["function"]["name"],
-                        tc["function"]["arguments"]
-                    )
-
-                    # Execute and get result
-                    result = execute_tool_call(tool_call_obj)
-
-                    # Add tool result to conversation
+                # Create tool call objects
+                class ToolCall:
+                    def __init__(self, id, function_name, arguments):
+                        self.id = id
+                        self.function = type('obj', (object,), {
+                            'name': function_name,
+                            'arguments': arguments
+                        })()
+
+                tool_call_objs = [
+                    ToolCall(tc["id"], tc["function"]["name"], tc["function"]["arguments"])
+                    for tc in collected_tool_calls
+                ]
+
+                # Execute all tool calls concurrently (results keep call order)
+                results = execute_tool_calls(tool_call_objs)
+
+                # Add tool results to conversation
+                for tc, result in zip(collected_tool_calls, results):
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tc["id"],
@@ -5,7 +5,7 @@ This module provides a decorator-based system for registering
 tools that the AI agent can use.
 """
 
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 
 
 class ToolRegistry:
@@ -14,6 +14,7 @@ class ToolRegistry:
     def __init__(self):
         self._tools: Dict[str, Callable] = {}
         self._tool_definitions: List[Dict[str, Any]] = []
+        self._rendered_descriptions: Optional[str] = None
 
     def register(
         self,
@@ -58,6 +59,7 @@ class ToolRegistry:
                     "parameters": parameters
                 }
             })
+            self._rendered_descriptions = None
 
             return func
 
@@ -75,6 +77,16 @@ class ToolRegistry:
         """Get tool definitions in OpenAI format."""
         return self._tool_definitions.copy()
 
+    @property
+    def rendered_descriptions(self) -> str:
+        """Tool descriptions as a Markdown bullet list (rebuilt only after a new registration)."""
+        if self._rendered_descriptions is None:
+            self._rendered_descriptions = "\n".join(
+                f"- {tool['function']['description']}"
+                for tool in self._tool_definitions
+            )
+        return self._rendered_descriptions
+
 
 # Global registry instance
 registry = ToolRegistry()
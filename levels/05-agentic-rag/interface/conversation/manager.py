@@ -2,9 +2,11 @@
 Conversation Manager - Handles interactive chat sessions with the AI agent.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from openai import OpenAI
 
 # Add project root to path for imports
@@ -16,23 +18,87 @@ from core.agent import run_agent_loop
 from interface.ui import print_separator, print_user_message, print_session_end, print_error
 
 
+PROMPT_FILE = Path(__file__).parent / "system_prompt.txt"
+
+# Piped or redirected input is read line by line without input()'s prompt
+# and line-editing machinery
+INTERACTIVE = sys.stdin.isatty()
+
+
+def _mtime_ns(path: Path) -> int:
+    """Modification time of path in nanoseconds, or 0 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _knowledge_base_signature(documents_path: Path) -> Tuple[int, ...]:
+    """
+    Cheaply fingerprint the knowledge base layout.
+
+    A directory's mtime changes when entries are added, removed or renamed,
+    so the mtimes of the documents directory and its category directories
+    change whenever the document tree would.
+
+    Args:
+        documents_path: Path to the documents directory
+
+    Returns:
+        Tuple of modification times (empty if the directory can't be read)
+    """
+    try:
+        with os.scandir(documents_path) as entries:
+            category_mtimes = sorted(
+                entry.stat().st_mtime_ns for entry in entries if entry.is_dir()
+            )
+        return (_mtime_ns(documents_path), *category_mtimes)
+    except OSError:
+        return ()
+
+
 def load_system_prompt() -> str:
     """
     Load the system prompt from file and inject document tree structure.
 
+    The assembled prompt is cached for the process and rebuilt only when the
+    prompt file or the knowledge base layout changes.
+
     Returns:
         System prompt content with document tree, or empty string if file not found
     """
-    prompt_file = Path(__file__).parent / "system_prompt.txt"
+    documents_path = Config.get_documents_path()
+    return _assemble_system_prompt(
+        documents_path,
+        _mtime_ns(PROMPT_FILE),
+        _knowledge_base_signature(documents_path)
+    )
+
+
+@lru_cache(maxsize=1)
+def _assemble_system_prompt(
+    documents_path: Path,
+    prompt_mtime_ns: int,
+    knowledge_base_signature: Tuple[int, ...]
+) -> str:
+    """
+    Build the system prompt (the mtime arguments only key the cache).
+
+    Args:
+        documents_path: Path to the documents directory
+        prompt_mtime_ns: Modification time of the prompt file
+        knowledge_base_signature: Output of _knowledge_base_signature()
 
+    Returns:
+        System prompt content with document tree
+    """
     # Load base system prompt
     base_prompt = ""
-    if prompt_file.exists():
-        base_prompt = prompt_file.read_text().strip()
+    if PROMPT_FILE.exists():
+        base_prompt = PROMPT_FILE.read_text().strip()
 
     # Generate document tree structure
     try:
-        documents_path = Config.get_documents_path()
         tree_structure = build_document_tree(documents_path)
 
         # Inject document tree into system prompt
@@ -55,6 +121,25 @@ When using search tools, you can optionally filter to a specific file by providi
         return base_prompt
 
 
+def read_user_input() -> str:
+    """
+    Read the next user message.
+
+    Returns:
+        The entered line, stripped
+
+    Raises:
+        EOFError: When input is exhausted
+    """
+    if INTERACTIVE:
+        return input("You: ").strip()
+
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
 def run_conversation(client: OpenAI, model: str) -> None:
     """
     Run an interactive conversation with the AI agent.
@@ -77,7 +162,7 @@ def run_conversation(client: OpenAI, model: str) -> None:
 
     while True:
         try:
-            user_input = input("You: ").strip()
+            user_input = read_user_input()
 
             if not user_input:
                 continue
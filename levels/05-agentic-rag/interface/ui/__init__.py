@@ -7,6 +7,9 @@ This module provides organized display components grouped by domain:
 - session: Welcome screens, separators, lifecycle messages
 """
 
+# Shared console used by every display module
+from ._console import console
+
 # Import all display functions from domain modules
 from .messages import (
     print_user_message,
@@ -28,6 +31,7 @@ from .session import (
 )
 
 __all__ = [
+    "console",
     # Messages
     "print_user_message",
     "print_assistant_message",
@@ -0,0 +1,14 @@
+"""Shared Rich console and panel factory for every UI module.
+
+One Console means one terminal capability probe and one output lock, so
+output from different display modules interleaves cleanly.
+"""
+
+from functools import partial
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+
+# Every panel in the UI is sized to its content
+compact_panel = partial(Panel, expand=False)
@@ -1,8 +1,6 @@
 """Display functions for user and assistant messages."""
 
-from rich.console import Console
-
-console = Console()
+from .._console import console
 
 
 def print_user_message(message: str):
@@ -16,7 +14,17 @@ def print_thinking():
 
 
 def print_assistant_message(message: str, stream: bool = False):
-    """Display an assistant message."""
-    if not stream:
-        console.print(f"\n[bold green]🤖 Assistant:[/bold green]")
-    console.print(message, end="" if stream else "\n")
+    """
+    Display an assistant message.
+
+    Streamed pieces are written to the terminal as-is: running Rich's markup
+    parser and highlighters on every token would cost more than the token,
+    and a piece can end mid-markup anyway. Only complete messages are styled.
+    """
+    if stream:
+        console.file.write(message)
+        console.file.flush()
+        return
+
+    console.print(f"\n[bold green]🤖 Assistant:[/bold green]")
+    console.print(message)
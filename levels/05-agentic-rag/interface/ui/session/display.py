@@ -2,28 +2,18 @@
 
 import sys
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 from shared import Config
 from tools.rag.utils import build_document_tree
-
-console = Console()
+from .._console import console, compact_panel
 
 
 def print_welcome(registry=None):
     """Display welcome message with dynamic tool capabilities."""
-    capabilities = ""
-    if registry:
-        tools = registry.get_tool_definitions()
-        capabilities = "\n".join(
-            f"- {tool['function']['description']}"
-            for tool in tools
-        )
+    capabilities = registry.rendered_descriptions if registry else ""
 
     # Generate document tree structure
     tree_structure = ""
@@ -51,12 +41,13 @@ This is an interactive AI agent that can use tools to help you.
 {tree_structure}
     """
 
+    from rich.markdown import Markdown  # markdown-it and Pygments load only here
+
     md = Markdown(welcome_text)
-    panel = Panel(
+    panel = compact_panel(
         md,
         title="[bold magenta]Welcome[/bold magenta]",
-        border_style="magenta",
-        expand=False
+        border_style="magenta"
     )
     console.print(panel)
 
@@ -73,10 +64,9 @@ def print_session_end():
 
 def print_error(error: str):
     """Display a general error."""
-    panel = Panel(
+    panel = compact_panel(
         error,
         title="[bold red]❌ Error[/bold red]",
-        border_style="red",
-        expand=False
+        border_style="red"
     )
     console.print(panel)
@@ -1,23 +1,39 @@
 """Display functions for tool calls."""
 
-import json
+import sys
+from pathlib import Path
 from typing import Dict, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-console = Console()
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from shared.io import dumps_json
+from .._console import console, compact_panel
+
+JSON_THEME = "monokai"
+
+# When output is piped or redirected there is nothing to style, so tool calls
+# are printed as plain text instead of highlighting and laying out a panel
+PLAIN_OUTPUT = not console.is_terminal
 
 
 def print_tool_call(function_name: str, arguments: Dict[str, Any]):
     """Display a tool call in a beautiful panel."""
-    args_json = json.dumps(arguments, indent=2)
-    syntax = Syntax(args_json, "json", theme="monokai", line_numbers=False)
+    args_json = dumps_json(arguments).decode()
+
+    if PLAIN_OUTPUT:
+        console.out(f"Tool Call: {function_name}\n{args_json}", highlight=False)
+        return
+
+    # Imported on first use: rich.syntax pulls in Pygments, which plain
+    # output never needs
+    from rich.syntax import Syntax
+
+    syntax = Syntax(args_json, "json", theme=JSON_THEME, line_numbers=False)
 
-    panel = Panel(
+    panel = compact_panel(
         syntax,
         title=f"[bold yellow]🔧 Tool Call: {function_name}[/bold yellow]",
-        border_style="yellow",
-        expand=False
+        border_style="yellow"
     )
     console.print(panel)
@@ -2,12 +2,9 @@
 
 import json
 from typing import Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.text import Text
 
-console = Console()
+from .._console import console, compact_panel
 
 
 def print_tool_result(result: Any):
@@ -54,13 +51,14 @@ def _print_dict_result(result: dict):
             console.print(f"[cyan]     • {key}:[/cyan] {value}")
     # Larger dictionary - use panel with JSON
     else:
+        from rich.syntax import Syntax  # Pygments is loaded only when needed
+
         result_json = json.dumps(result, indent=2)
         syntax = Syntax(result_json, "json", theme="monokai", line_numbers=False)
-        panel = Panel(
+        panel = compact_panel(
             syntax,
             title="[bold cyan]✓ Result[/bold cyan]",
-            border_style="cyan",
-            expand=False
+            border_style="cyan"
         )
         console.print(panel)
 
@@ -95,11 +93,10 @@ def _print_search_results(result: dict):
         result_text.append(f"{score:.4f}\n\n", style="yellow")
         result_text.append(display_content, style="white")
 
-        panel = Panel(
+        panel = compact_panel(
             result_text,
             title=f"[bold cyan]Result {idx}/{result_count}[/bold cyan]",
-            border_style="cyan",
-            expand=False
+            border_style="cyan"
         )
         console.print(panel)
 
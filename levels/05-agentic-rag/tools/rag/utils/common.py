@@ -5,6 +5,7 @@ Provides centralized initialization and configuration for all search tools.
 """
 
 import sys
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -30,7 +31,10 @@ _vector_store = None
 _bm25_search = None
 _documents = None
 _collection_name = "agentic_rag_docs"
+_bm25_index_file = Config.SHARED_PATH / "data" / f"{_collection_name}_bm25.npz"
 _initialized = False
+_init_lock = threading.Lock()  # Parallel tool calls may all trigger the first initialize()
+_metadata_cache: Dict[str, Dict[str, Any]] = {}  # doc_id -> payload (immutable once indexed)
 
 
 def initialize():
@@ -40,11 +44,18 @@ def initialize():
     Raises:
         RuntimeError: If initialization fails
     """
-    global _embedder, _vector_store, _bm25_search, _documents, _initialized
-
     if _initialized:
         return
 
+    with _init_lock:
+        if not _initialized:
+            _initialize_locked()
+
+
+def _initialize_locked():
+    """Do the one-time initialization (caller holds _init_lock)."""
+    global _embedder, _vector_store, _bm25_search, _documents, _initialized
+
     try:
         # Validate configuration
         Config.validate()
@@ -60,9 +71,15 @@ def initialize():
         if not _documents:
             raise ValueError(f"No documents found in {documents_path}")
 
-        # Initialize BM25 search
+        # Initialize BM25 search, reusing the index saved by an earlier run
+        # when it was built from the same documents
         _bm25_search = BM25Search(_documents)
-        _bm25_search.index()
+        if not _bm25_search.load_index(_bm25_index_file):
+            _bm25_search.index()
+            try:
+                _bm25_search.save_index(_bm25_index_file)
+            except OSError:
+                pass  # Caching is best-effort; the in-memory index is ready
 
         # Load and index documents if collection doesn't exist
         if not _vector_store.collection_exists(_collection_name):
@@ -193,6 +210,9 @@ def format_results(
     """
     Format search results with full content and metadata.
 
+    Metadata not seen before is fetched for all hits in one request and
+    kept for the rest of the process.
+
     Args:
         search_results: List of (doc_id, score) tuples
         vector_store: Vector store instance
@@ -201,14 +221,17 @@ def format_results(
     Returns:
         List of formatted result dictionaries
     """
+    # Skip results with exactly zero relevance (no match at all)
+    # Note: Small positive scores are still relevant, especially in single-file searches
+    search_results = [(doc_id, score) for doc_id, score in search_results if score != 0]
+
+    missing = [doc_id for doc_id, _ in search_results if doc_id not in _metadata_cache]
+    if missing:
+        _metadata_cache.update(vector_store.get_metadata_batch(collection_name, missing))
+
     results = []
     for doc_id, score in search_results:
-        # Skip results with exactly zero relevance (no match at all)
-        # Note: Small positive scores are still relevant, especially in single-file searches
-        if score == 0:
-            continue
-
-        metadata = vector_store.get_metadata(collection_name, doc_id)
+        metadata = _metadata_cache.get(doc_id)
         if metadata:
             results.append({
                 "document_id": doc_id,
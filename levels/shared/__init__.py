@@ -12,21 +12,29 @@ organized by domain:
 """
 
 from .config import Config
-from .data import load_documents, count_documents
+from .data import load_documents, iter_documents, index_documents, load_document, load_text_files, read_text_files, count_documents, DocumentStore
 from .retrieval import Embedder, VectorStore, QdrantVectorStore, cosine_similarity
 from .io import OutputManager
-from .utils import setup_logger
-from .cache import EmbeddingCache
+from .utils import setup_logger, make_preview
+from .cache import EmbeddingCache, QueryCache
 
 __all__ = [
     "Config",
     "load_documents",
+    "iter_documents",
+    "index_documents",
+    "load_document",
+    "load_text_files",
+    "read_text_files",
     "count_documents",
+    "DocumentStore",
     "Embedder",
     "VectorStore",
     "QdrantVectorStore",
     "cosine_similarity",
     "OutputManager",
     "setup_logger",
+    "make_preview",
     "EmbeddingCache",
+    "QueryCache",
 ]
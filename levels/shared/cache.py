@@ -1,13 +1,21 @@
 """
 Cache management for vector embeddings.
 
-Provides hash-based tracking to avoid re-embedding unchanged documents.
+Provides hash-based tracking to avoid re-embedding unchanged documents, plus
+a content-addressed store of document vectors so only new or changed texts
+are sent to the embedding API. Also provides an in-memory query cache for
+interactive search loops.
 """
 
 import json
 import hashlib
+import os
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+import numpy as np
 
 
 class EmbeddingCache:
@@ -23,6 +31,8 @@ class EmbeddingCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "embedding_cache.json"
+        self.vectors_file = self.cache_dir / "embedding_vectors.npz"
+        self._vectors: Optional[dict] = None
 
     def _compute_hash(self, documents: list[dict]) -> str:
         """
@@ -119,3 +129,281 @@ class EmbeddingCache:
             "document_count": len(documents),
         }
         self._save_cache_metadata(collection_name, metadata)
+
+    @staticmethod
+    def _content_key(model: str, content: str) -> str:
+        """
+        Compute the cache key for a text under a given embedding model.
+
+        Args:
+            model: Embedding model name (vectors differ between models)
+            content: Text content
+
+        Returns:
+            Hex digest identifying the (model, content) pair
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(content.encode())
+        return digest.hexdigest()
+
+    def _load_vectors(self) -> dict:
+        """Load the vector store from disk once, keyed by content hash."""
+        if self._vectors is None:
+            self._vectors = {}
+            if self.vectors_file.exists():
+                try:
+                    with np.load(self.vectors_file) as data:
+                        self._vectors = {key: data[key] for key in data.files}
+                except (OSError, ValueError):
+                    self._vectors = {}
+        return self._vectors
+
+    def _save_vectors(self) -> None:
+        """
+        Persist the vector store to disk atomically (temp file, then rename).
+
+        An interrupted write leaves the previous store intact instead of a
+        truncated file that would force the whole corpus to be re-embedded.
+        """
+        self._replace_file(self.vectors_file, lambda f: np.savez(f, **self._vectors))
+
+    def _replace_file(self, path: Path, write: Callable[[Any], None]) -> None:
+        """
+        Write a file under a temporary name, then rename it over `path`.
+
+        Readers (including ones that memory-mapped the old file) keep seeing
+        a complete file, old or new, never a partially written one.
+
+        Args:
+            path: Destination file inside cache_dir
+            write: Function writing the contents to a binary file object
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=path.suffix + ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def embed_texts(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], np.ndarray],
+        model: str,
+    ) -> np.ndarray:
+        """
+        Embed texts, reusing vectors cached from earlier runs.
+
+        Only texts not seen before under `model` (each distinct text once)
+        are passed to embed_fn, in a single call; results are spliced back
+        into input order. Vectors are stored as float16 (half the disk and
+        load size) and returned as float32; fresh embeddings are returned at
+        full precision, so only vectors reused from the store carry the
+        float16 rounding.
+
+        Args:
+            texts: Texts to embed
+            embed_fn: Function embedding a list of texts (used for cache misses)
+            model: Embedding model name (part of the cache key)
+
+        Returns:
+            float32 NumPy array of embeddings in input order
+        """
+        if not texts:
+            return np.array([])
+
+        vectors = self._load_vectors()
+        keys = [self._content_key(model, text) for text in texts]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing:
+                missing[key] = text
+
+        fresh = {}
+        if missing:
+            new_embeddings = np.asarray(embed_fn(list(missing.values())), dtype=np.float32)
+            for key, embedding in zip(missing, new_embeddings):
+                fresh[key] = embedding
+                vectors[key] = embedding.astype(np.float16)
+            self._save_vectors()
+
+        return np.stack([
+            fresh[key] if key in fresh else vectors[key] for key in keys
+        ]).astype(np.float32, copy=False)
+
+    def embed_documents(self, documents: list[dict], embedder) -> np.ndarray:
+        """
+        Embed document contents, reusing vectors cached from earlier runs.
+
+        Only documents whose content (under the embedder's model) has not
+        been seen before are sent to the API, in a single batched call.
+
+        Args:
+            documents: List of document dicts with 'content' key
+            embedder: Embedder instance used for cache misses
+
+        Returns:
+            NumPy array of embeddings in document order
+        """
+        return self.embed_texts([doc["content"] for doc in documents], embedder.embed, embedder.model)
+
+    def _matrix_paths(self, collection_name: str) -> tuple:
+        """Paths of a collection's saved matrix and its fingerprint file."""
+        matrix_file = self.cache_dir / f"{collection_name}.npy"
+        return matrix_file, matrix_file.with_suffix(".npy.key")
+
+    @staticmethod
+    def _matrix_fingerprint(model: str, documents: list[dict]) -> str:
+        """Hash of the model plus every (id, content) pair, in order."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model.encode())
+        for doc in documents:
+            digest.update(b"\0")
+            digest.update(doc["id"].encode())
+            digest.update(b"\0")
+            digest.update(doc["content"].encode())
+        return digest.hexdigest()
+
+    def save_matrix(
+        self,
+        collection_name: str,
+        documents: list[dict],
+        model: str,
+        matrix: np.ndarray,
+    ) -> None:
+        """
+        Persist a collection's (normalized) embedding matrix as a .npy file.
+
+        The old fingerprint is removed first and the new one written last, so
+        an interrupted save leaves no fingerprint rather than one describing
+        a different matrix.
+
+        Args:
+            collection_name: Name of the vector collection
+            documents: Documents the matrix rows correspond to
+            model: Embedding model that produced the matrix
+            matrix: 2D array with one row per document
+        """
+        matrix_file, key_file = self._matrix_paths(collection_name)
+        key_file.unlink(missing_ok=True)
+        self._replace_file(matrix_file, lambda f: np.save(f, matrix))
+        fingerprint = self._matrix_fingerprint(model, documents).encode()
+        self._replace_file(key_file, lambda f: f.write(fingerprint))
+
+    def load_matrix(
+        self,
+        collection_name: str,
+        documents: list[dict],
+        model: str,
+    ) -> Optional[np.ndarray]:
+        """
+        Memory-map a matrix saved by save_matrix() if it matches the documents.
+
+        Pages are read lazily, so warm starts skip both the embedding lookups
+        and normalization, and concurrent processes share the page cache.
+
+        Args:
+            collection_name: Name of the vector collection
+            documents: Documents the rows must correspond to
+            model: Embedding model the matrix must come from
+
+        Returns:
+            Read-only memory-mapped matrix, or None if missing or stale
+        """
+        matrix_file, key_file = self._matrix_paths(collection_name)
+        if not matrix_file.exists() or not key_file.exists():
+            return None
+
+        try:
+            if key_file.read_text() != self._matrix_fingerprint(model, documents):
+                return None
+            matrix = np.load(matrix_file, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        if matrix.ndim != 2 or len(matrix) != len(documents):
+            return None
+
+        return matrix
+
+
+class QueryCache:
+    """
+    LRU cache of search results for repeated or near-identical queries.
+
+    Lookups first try the exact query text (no API call at all). On a miss
+    the query is embedded and compared against the embeddings of cached
+    queries; if one is at least `similarity_threshold` cosine-similar, its
+    results are reused instead of searching the vector store again.
+    """
+
+    def __init__(self, max_size: int = 256, similarity_threshold: float = 0.97):
+        """
+        Initialize the query cache.
+
+        Args:
+            max_size: Maximum number of cached queries (least recently used evicted)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        # query -> (unit query embedding, results)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get_or_compute(
+        self,
+        query: str,
+        embed_fn: Callable[[str], np.ndarray],
+        search_fn: Callable[[np.ndarray], Any],
+    ) -> Any:
+        """
+        Return cached results for a query, computing them on a miss.
+
+        Args:
+            query: Query text
+            embed_fn: Function mapping query text to its embedding
+            search_fn: Function mapping a query embedding to search results
+
+        Returns:
+            Search results (cached or freshly computed)
+        """
+        if query in self._entries:
+            self._entries.move_to_end(query)
+            return self._entries[query][1]
+
+        query_embedding = np.asarray(embed_fn(query), dtype=np.float32)
+        unit = query_embedding / (np.linalg.norm(query_embedding) or 1.0)
+
+        similar = self._find_similar(unit)
+        if similar is not None:
+            self._entries.move_to_end(similar)
+            return self._entries[similar][1]
+
+        results = search_fn(query_embedding)
+        self._entries[query] = (unit, results)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return results
+
+    def _find_similar(self, unit_embedding: np.ndarray) -> Optional[str]:
+        """Return the cached query most similar to the embedding, if above threshold."""
+        if not self._entries:
+            return None
+
+        queries = list(self._entries)
+        similarities = np.stack([entry[0] for entry in self._entries.values()]) @ unit_embedding
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.similarity_threshold:
+            return queries[best]
+        return None
+
+    def clear(self) -> None:
+        """Drop all cached queries."""
+        self._entries.clear()
@@ -28,6 +28,9 @@ class Config:
     EMBEDDING_BASE_URL: str = os.getenv("EMBEDDING_BASE_URL", "")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
     EMBEDDING_DIMENSION: int = 1536  # text-embedding-3-small default
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "96"))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "8"))
+    EMBEDDING_MAX_BATCH_TOKENS: int = int(os.getenv("EMBEDDING_MAX_BATCH_TOKENS", "300000"))
 
     # LLM API (OpenAI-compatible) - for Agentic RAG and Contextual Retrieval
     LLM_API_KEY: str = os.getenv("LLM_API_KEY", "")
@@ -40,6 +43,14 @@ class Config:
     QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     QDRANT_API_KEY: Optional[str] = os.getenv("QDRANT_API_KEY")
     QDRANT_USE_HTTPS: bool = os.getenv("QDRANT_USE_HTTPS", "false").lower() == "true"
+    # Store an int8 copy of each vector for the first search pass (4x smaller
+    # than float32); top candidates are rescored against the original vectors
+    QDRANT_INT8_QUANTIZATION: bool = os.getenv("QDRANT_INT8_QUANTIZATION", "true").lower() == "true"
+    # HNSW graph parameters: M = links per node, EF_CONSTRUCT = build-time
+    # candidate list, EF = search-time candidate list (higher = more accurate)
+    QDRANT_HNSW_M: int = int(os.getenv("QDRANT_HNSW_M", "16"))
+    QDRANT_HNSW_EF_CONSTRUCT: int = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "200"))
+    QDRANT_HNSW_EF: int = int(os.getenv("QDRANT_HNSW_EF", "64"))
 
     # Retrieval defaults
     DEFAULT_TOP_K: int = 5
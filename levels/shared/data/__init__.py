@@ -1,5 +1,15 @@
 """Data loading utilities for RAG system."""
 
-from .loader import load_documents, count_documents
+from .loader import load_documents, iter_documents, index_documents, load_document, load_text_files, read_text_files, count_documents
+from .document_store import DocumentStore
 
-__all__ = ["load_documents", "count_documents"]
+__all__ = [
+    "load_documents",
+    "iter_documents",
+    "index_documents",
+    "load_document",
+    "load_text_files",
+    "read_text_files",
+    "count_documents",
+    "DocumentStore",
+]
@@ -0,0 +1,52 @@
+"""
+Columnar (structure-of-arrays) view of loaded documents.
+
+load_documents returns a list of dicts, which is convenient to build but
+means every lookup walks Python objects. DocumentStore keeps each field in
+its own array plus a single id -> row map, so retrieval results can be
+turned into display data by row index.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from ..utils.text import make_preview
+
+
+class DocumentStore:
+    """Parallel arrays of document ids, paths, contents and display previews."""
+
+    def __init__(self, documents: List[Dict[str, str]], preview_chars: int = 200):
+        """
+        Build the columns from loaded documents.
+
+        Args:
+            documents: List of document dicts with 'id', 'content' and optional 'path'
+            preview_chars: Length of the precomputed previews (stripped content)
+        """
+        self.ids = np.array([doc["id"] for doc in documents], dtype=object)
+        self.paths = np.array([doc.get("path", "") for doc in documents], dtype=object)
+        self.contents = np.array([doc["content"] for doc in documents], dtype=object)
+        # The corpus is fixed, so previews are built once rather than per query
+        self.previews = np.array(
+            [make_preview(doc["content"].strip(), preview_chars) for doc in documents],
+            dtype=object,
+        )
+        self.id_to_row: Dict[str, int] = {doc_id: row for row, doc_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        """Number of documents in the store."""
+        return len(self.ids)
+
+    def row(self, doc_id: str) -> int:
+        """
+        Get the row index of a document.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Row index, or -1 if the id is unknown
+        """
+        return self.id_to_row.get(doc_id, -1)
@@ -5,22 +5,99 @@ Provides functionality to load text documents from the documents directory,
 maintaining consistent structure across all training levels.
 """
 
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional
+
+# File reads are I/O-bound, so a generous thread pool keeps the disk queue full
+MAX_READ_WORKERS = 32
+
+# Files at least this large are decoded straight from a memory map
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _scan_txt_files(directory: str) -> List[os.DirEntry]:
+    """Return .txt file entries in a directory, in directory order."""
+    with os.scandir(directory) as it:
+        return [
+            entry for entry in it
+            if entry.name.endswith(".txt") and entry.is_file()
+        ]
+
+
+def _read_file(path: str) -> Optional[str]:
+    """Read a UTF-8 text file, returning None (with a warning) on failure."""
+    try:
+        # One binary read + C-level decode skips the TextIOWrapper decoder;
+        # newlines are normalized the same way text mode would. Large files
+        # are decoded from a memory map so no intermediate bytes copy exists.
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = str(mapped, "utf-8")
+            else:
+                content = f.read().decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+    except Exception as e:
+        print(f"Warning: Failed to load {path}: {e}")
+        return None
+
+
+def read_text_files(paths: List[Path]) -> List[str]:
+    """
+    Read text files concurrently, preserving input order.
 
+    Files that fail to read are skipped with a warning.
 
-def load_documents(documents_path: Path) -> List[Dict[str, str]]:
+    Args:
+        paths: Paths of UTF-8 text files
+
+    Returns:
+        List of file contents in the order of paths
     """
-    Load all text documents from the specified documents directory.
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as executor:
+        contents = executor.map(_read_file, [str(path) for path in paths])
+
+    return [content for content in contents if content is not None]
+
+
+def _read_documents(files: List[tuple]) -> List[Dict[str, str]]:
+    """
+    Read (doc_id, path) pairs concurrently, preserving input order.
 
     Args:
-        documents_path: Path to the documents directory
+        files: List of (doc_id, path) tuples
 
     Returns:
-        List of document dictionaries with 'id', 'path', and 'content' keys
+        List of document dictionaries for the files that could be read
+    """
+    if not files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(files))) as executor:
+        contents = executor.map(_read_file, [path for _, path in files])
+
+    return [
+        {"id": doc_id, "path": path, "content": content}
+        for (doc_id, path), content in zip(files, contents)
+        if content is not None
+    ]
+
+
+def _document_files(documents_path: Path) -> List[tuple]:
+    """
+    List (doc_id, path) pairs for every .txt file one level below documents_path.
 
     Raises:
         FileNotFoundError: If documents_path does not exist
+        ValueError: If documents_path is not a directory
     """
     if not documents_path.exists():
         raise FileNotFoundError(f"Documents path does not exist: {documents_path}")
@@ -28,26 +105,113 @@ def load_documents(documents_path: Path) -> List[Dict[str, str]]:
     if not documents_path.is_dir():
         raise ValueError(f"Documents path is not a directory: {documents_path}")
 
-    documents = []
+    files = []
+
+    with os.scandir(documents_path) as it:
+        doc_dirs = [entry for entry in it if entry.is_dir()]
 
-    for doc_dir in documents_path.iterdir():
-        if not doc_dir.is_dir():
-            continue
+    for doc_dir in doc_dirs:
+        for doc_file in _scan_txt_files(doc_dir.path):
+            files.append((f"{doc_dir.name}/{doc_file.name}", doc_file.path))
+
+    return files
+
+
+def index_documents(documents_path: Path) -> Dict[str, str]:
+    """
+    Map every document id to its file path without reading any file.
+
+    Lets a caller pick documents by id in O(1) and then read only those
+    (e.g. with load_document()).
+
+    Args:
+        documents_path: Path to the documents directory
+
+    Returns:
+        Dict of doc_id -> path, in the same order as load_documents
+
+    Raises:
+        FileNotFoundError: If documents_path does not exist
+    """
+    return dict(_document_files(documents_path))
+
+
+def load_document(doc_id: str, path: str) -> Optional[Dict[str, str]]:
+    """
+    Read a single document found via index_documents().
+
+    Args:
+        doc_id: Document identifier
+        path: Path to the document file
 
-        for doc_file in doc_dir.glob("*.txt"):
-            try:
-                with open(doc_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    documents.append({
-                        "id": f"{doc_dir.name}/{doc_file.name}",
-                        "path": str(doc_file),
-                        "content": content,
-                    })
-            except Exception as e:
-                print(f"Warning: Failed to load {doc_file}: {e}")
-                continue
+    Returns:
+        Document dictionary with 'id', 'path', and 'content' keys, or None
+        if the file could not be read
+    """
+    content = _read_file(path)
+    if content is None:
+        return None
+    return {"id": doc_id, "path": path, "content": content}
+
+
+def load_documents(documents_path: Path) -> List[Dict[str, str]]:
+    """
+    Load all text documents from the specified documents directory.
+
+    Args:
+        documents_path: Path to the documents directory
+
+    Returns:
+        List of document dictionaries with 'id', 'path', and 'content' keys
+
+    Raises:
+        FileNotFoundError: If documents_path does not exist
+    """
+    return _read_documents(_document_files(documents_path))
+
+
+def iter_documents(documents_path: Path) -> Iterator[Dict[str, str]]:
+    """
+    Lazily yield text documents from the documents directory.
+
+    Same documents and order as load_documents, but each file is read only
+    when the iterator reaches it, so a caller that stops early (e.g. next()
+    over a filter) never reads the rest and holds one document at a time.
+
+    Args:
+        documents_path: Path to the documents directory
+
+    Yields:
+        Document dictionaries with 'id', 'path', and 'content' keys
+
+    Raises:
+        FileNotFoundError: If documents_path does not exist
+    """
+    for doc_id, path in _document_files(documents_path):
+        content = _read_file(path)
+        if content is not None:
+            yield {"id": doc_id, "path": path, "content": content}
+
+
+def load_text_files(directory: Path, id_prefix: str) -> List[Dict[str, str]]:
+    """
+    Load all .txt files directly inside a single (flat) directory.
+
+    Args:
+        directory: Directory containing .txt files
+        id_prefix: Prefix for document ids (ids are '<id_prefix>/<file name>')
+
+    Returns:
+        List of document dictionaries with 'id', 'path', and 'content' keys
+    """
+    if not directory.exists() or not directory.is_dir():
+        return []
 
-    return documents
+    files = [
+        (f"{id_prefix}/{entry.name}", entry.path)
+        for entry in _scan_txt_files(str(directory))
+    ]
+    return _read_documents(files)
 
 
 def count_documents(documents_path: Path) -> int:
@@ -63,9 +227,7 @@ def count_documents(documents_path: Path) -> int:
     if not documents_path.exists() or not documents_path.is_dir():
         return 0
 
-    count = 0
-    for doc_dir in documents_path.iterdir():
-        if doc_dir.is_dir():
-            count += len(list(doc_dir.glob("*.txt")))
+    with os.scandir(documents_path) as it:
+        doc_dirs = [entry.path for entry in it if entry.is_dir()]
 
-    return count
+    return sum(len(_scan_txt_files(doc_dir)) for doc_dir in doc_dirs)
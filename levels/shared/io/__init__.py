@@ -1,5 +1,5 @@
 """Input/Output utilities for RAG system."""
 
-from .output_manager import OutputManager
+from .output_manager import OutputManager, dumps_json, loads_json
 
-__all__ = ["OutputManager"]
+__all__ = ["OutputManager", "dumps_json", "loads_json"]
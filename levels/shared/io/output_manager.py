@@ -11,6 +11,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import numpy as np
 
+from ..utils.text import make_preview
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; falls back to stdlib json
+    orjson = None
+
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles NumPy types."""
@@ -25,6 +32,58 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _orjson_default(obj):
+    """Fallback for values orjson cannot serialize natively (e.g. non-contiguous arrays)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data (including NumPy values) to UTF-8 JSON bytes.
+
+    Uses orjson when installed, otherwise the stdlib json module with
+    NumpyEncoder. Both paths emit non-ASCII characters unescaped.
+
+    Args:
+        data: JSON-serializable data, may contain NumPy scalars/arrays
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_orjson_default, option=option)
+
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, cls=NumpyEncoder
+    ).encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes, with orjson when installed.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Decoded Python data
+
+    Raises:
+        json.JSONDecodeError: If raw is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class OutputManager:
     """Manages saving and formatting of RAG system outputs."""
 
@@ -60,8 +119,7 @@ class OutputManager:
 
         output_file = self.output_path / f"{filename}.json"
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+        output_file.write_bytes(dumps_json(results))
 
         return output_file
 
@@ -118,9 +176,7 @@ class OutputManager:
             lines.append(f"Document: {doc_id}")
 
             if "content" in result:
-                content = result["content"]
-                preview = content[:200] + "..." if len(content) > 200 else content
-                lines.append(f"Preview: {preview}")
+                lines.append(f"Preview: {make_preview(result['content'], 200)}")
 
             if "metadata" in result:
                 lines.append(f"Metadata: {result['metadata']}")
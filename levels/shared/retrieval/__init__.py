@@ -2,8 +2,16 @@
 
 from .embedder import Embedder
 from .vector_store import VectorStore, QdrantVectorStore
-from .similarity import cosine_similarity, euclidean_distance, dot_product_similarity
-from .bm25 import BM25Search, reciprocal_rank_fusion
+from .similarity import (
+    cosine_similarity,
+    euclidean_distance,
+    dot_product_similarity,
+    normalize_embeddings,
+    top_k_indices,
+    top_k_dot,
+    dot_scores,
+)
+from .bm25 import BM25Search, SparseBM25, reciprocal_rank_fusion, tokenize, tokenize_query
 
 __all__ = [
     "Embedder",
@@ -12,6 +20,13 @@ __all__ = [
     "cosine_similarity",
     "euclidean_distance",
     "dot_product_similarity",
+    "normalize_embeddings",
+    "top_k_indices",
+    "top_k_dot",
+    "dot_scores",
     "BM25Search",
+    "SparseBM25",
     "reciprocal_rank_fusion",
+    "tokenize",
+    "tokenize_query",
 ]
@@ -5,10 +5,182 @@ Provides BM25-based keyword search functionality that can be used
 standalone or in hybrid retrieval scenarios.
 """
 
-from typing import List, Dict, Tuple, Optional
-from rank_bm25 import BM25Okapi
+import hashlib
+import os
+import re
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Sequence
 import numpy as np
 
+from .similarity import top_k_indices
+
+# Word characters plus hyphens, so IDs like "784-1992-7856432-1" stay one token
+_TOKEN_PATTERN = re.compile(r"[\w-]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase and split text into BM25 tokens, dropping punctuation.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=1024)
+def tokenize_query(query: str) -> Tuple[str, ...]:
+    """Tokenize a query, caching results for repeated interactive queries."""
+    return tuple(tokenize(query))
+
+
+class SparseBM25:
+    """
+    Okapi BM25 scorer backed by a CSR-style inverted index.
+
+    Drop-in replacement for rank_bm25.BM25Okapi (same parameters, same
+    scores), but postings live in flat NumPy arrays so a query is scored with
+    a handful of vectorized operations instead of a Python loop over every
+    document for every query term.
+
+    Each posting stores its final BM25 weight, computed once at index time:
+
+        W[d, t] = idf[t] * tf[d, t] * (k1 + 1)
+                  / (tf[d, t] + k1 * (1 - b + b * doc_len[d] / avgdl))
+
+    so scoring a query is only a gather and a sum (times the query term
+    count). The raw term frequencies are not kept.
+    """
+
+    def __init__(
+        self,
+        corpus: List[List[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        """
+        Build the inverted index.
+
+        Args:
+            corpus: List of tokenized documents
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+            epsilon: Floor for negative IDFs, as a fraction of the average IDF
+        """
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
+
+        self.doc_len = np.array([len(doc) for doc in corpus], dtype=np.float64)
+        self.avgdl = float(self.doc_len.mean()) if self.corpus_size else 0.0
+
+        # Per-document term frequencies, then regrouped by term (CSR rows = terms)
+        self.vocab: Dict[str, int] = {}
+        term_ids, doc_ids, freqs = [], [], []
+        for doc_idx, doc in enumerate(corpus):
+            counts: Dict[str, int] = {}
+            for token in doc:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                term_ids.append(self.vocab.setdefault(token, len(self.vocab)))
+                doc_ids.append(doc_idx)
+                freqs.append(count)
+
+        term_ids = np.array(term_ids, dtype=np.int64)
+        order = np.argsort(term_ids, kind="stable")
+        term_ids = term_ids[order]
+        self.postings_docs = np.array(doc_ids, dtype=np.int64)[order]
+        tf = np.array(freqs, dtype=np.float64)[order]
+
+        doc_freq = np.bincount(term_ids, minlength=len(self.vocab))
+        self.indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=self.indptr[1:])
+
+        self.idf = self._compute_idf(doc_freq)
+
+        # Fold IDF, saturation and length normalization into one weight per posting
+        length_norm = 1 - b + b * self.doc_len[self.postings_docs] / (self.avgdl or 1.0)
+        self.postings_weight = self.idf[term_ids] * tf * (k1 + 1) / (tf + k1 * length_norm)
+
+    # Arrays that fully describe a built index (see to_arrays/from_arrays)
+    _ARRAY_FIELDS = ("doc_len", "indptr", "postings_docs", "postings_weight", "idf")
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Export the built index as plain arrays (e.g. for np.savez).
+
+        Returns:
+            Dict of arrays, including the vocabulary ordered by term id
+        """
+        arrays = {name: getattr(self, name) for name in self._ARRAY_FIELDS}
+        arrays["vocab"] = np.array(list(self.vocab), dtype=str)
+        arrays["params"] = np.array([self.k1, self.b, self.epsilon])
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "SparseBM25":
+        """
+        Rebuild an index from to_arrays() output without re-tokenizing.
+
+        Args:
+            arrays: Mapping with the arrays written by to_arrays()
+
+        Returns:
+            SparseBM25 that scores exactly like the exported one
+        """
+        index = cls.__new__(cls)
+        index.k1, index.b, index.epsilon = (float(x) for x in arrays["params"])
+        for name in cls._ARRAY_FIELDS:
+            setattr(index, name, arrays[name])
+        index.vocab = {term: term_id for term_id, term in enumerate(arrays["vocab"].tolist())}
+        index.corpus_size = len(index.doc_len)
+        index.avgdl = float(index.doc_len.mean()) if index.corpus_size else 0.0
+        return index
+
+    def _compute_idf(self, doc_freq: np.ndarray) -> np.ndarray:
+        """Compute IDF per term, flooring negative values like BM25Okapi."""
+        if len(doc_freq) == 0:
+            return np.zeros(0)
+
+        idf = np.log(self.corpus_size - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+        idf[idf < 0] = self.epsilon * idf.mean()
+        return idf
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """
+        Score every document against a tokenized query.
+
+        Args:
+            query: List of query tokens (repeated tokens count repeatedly)
+
+        Returns:
+            Array of BM25 scores, one per document
+        """
+        term_counts: Dict[int, int] = {}
+        for token in query:
+            term_id = self.vocab.get(token)
+            if term_id is not None:
+                term_counts[term_id] = term_counts.get(term_id, 0) + 1
+
+        if not term_counts:
+            return np.zeros(self.corpus_size)
+
+        # Gather the precomputed postings of every query term into one flat slice
+        spans = [(self.indptr[t], self.indptr[t + 1], count) for t, count in term_counts.items()]
+        docs = np.concatenate([self.postings_docs[start:end] for start, end, _ in spans])
+        contributions = np.concatenate([
+            self.postings_weight[start:end] * count for start, end, count in spans
+        ])
+
+        return np.bincount(docs, weights=contributions, minlength=self.corpus_size)
+
 
 class BM25Search:
     """BM25 keyword search for document retrieval."""
@@ -23,6 +195,7 @@ class BM25Search:
         self.documents = documents or []
         self.bm25 = None
         self.tokenized_docs = []
+        self.doc_ids = np.array([], dtype=object)
         self._indexed = False
 
     def index(self, documents: Optional[List[Dict]] = None) -> None:
@@ -38,15 +211,87 @@ class BM25Search:
         if not self.documents:
             raise ValueError("No documents provided for indexing")
 
-        # Tokenize documents (simple whitespace tokenization)
-        self.tokenized_docs = [
-            doc["content"].lower().split() for doc in self.documents
-        ]
+        # Tokenize documents
+        self.tokenized_docs = [tokenize(doc["content"]) for doc in self.documents]
+
+        # Ids as an array so results are gathered by index instead of per-dict lookups
+        self.doc_ids = np.array([doc["id"] for doc in self.documents], dtype=object)
 
         # Build BM25 index
-        self.bm25 = BM25Okapi(self.tokenized_docs)
+        self.bm25 = SparseBM25(self.tokenized_docs)
         self._indexed = True
 
+    @staticmethod
+    def _fingerprint(documents: List[Dict]) -> str:
+        """Hash of every (id, content) pair, in order."""
+        digest = hashlib.blake2b(digest_size=16)
+        for doc in documents:
+            digest.update(doc["id"].encode())
+            digest.update(b"\0")
+            digest.update(doc["content"].encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def save_index(self, path: Path) -> None:
+        """
+        Persist the built index as an .npz file (written atomically).
+
+        Args:
+            path: Destination file
+
+        Raises:
+            ValueError: If index() hasn't been called
+        """
+        if not self._indexed or self.bm25 is None:
+            raise ValueError("BM25 index not built. Call index() first.")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    fingerprint=np.array(self._fingerprint(self.documents)),
+                    doc_ids=self.doc_ids.astype(str),
+                    **self.bm25.to_arrays(),
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load_index(self, path: Path) -> bool:
+        """
+        Load an index saved by save_index() if it was built from the same documents.
+
+        Skips tokenization and index construction entirely on warm starts.
+        tokenized_docs stays empty for a loaded index.
+
+        Args:
+            path: File written by save_index()
+
+        Returns:
+            True if the index was loaded, False if missing, unreadable or stale
+        """
+        if not self.documents or not Path(path).exists():
+            return False
+
+        try:
+            with np.load(path) as arrays:
+                if str(arrays["fingerprint"]) != self._fingerprint(self.documents):
+                    return False
+                bm25 = SparseBM25.from_arrays(arrays)
+                doc_ids = arrays["doc_ids"].astype(object)
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self.bm25 = bm25
+        self.doc_ids = doc_ids
+        self.tokenized_docs = []
+        self._indexed = True
+        return True
+
     def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
         """
         Search documents using BM25 scoring.
@@ -65,23 +310,16 @@ class BM25Search:
             raise ValueError("BM25 index not built. Call index() first.")
 
         # Tokenize query
-        tokenized_query = query.lower().split()
+        tokenized_query = tokenize_query(query)
 
         # Get BM25 scores for all documents
         scores = self.bm25.get_scores(tokenized_query)
 
         # Get top-k document indices sorted by score
-        top_indices = np.argsort(scores)[::-1][:top_k]
-
-        # Build results list with document IDs and scores
-        results = []
-        for idx in top_indices:
-            if idx < len(self.documents):
-                doc_id = self.documents[idx]["id"]
-                score = float(scores[idx])
-                results.append((doc_id, score))
+        top_indices = top_k_indices(scores, top_k)
 
-        return results
+        # Gather document IDs and scores for the winners in one step each
+        return list(zip(self.doc_ids[top_indices].tolist(), scores[top_indices].tolist()))
 
     def is_indexed(self) -> bool:
         """Check if the BM25 index has been built."""
@@ -6,17 +6,37 @@ processing and single query embeddings. Works with any OpenAI-compatible
 embedding endpoint (OpenAI, Groq, LocalAI, etc.).
 """
 
-from typing import List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import numpy as np
 from openai import OpenAI
 
+try:
+    import tiktoken
+except ImportError:  # Token counts fall back to UTF-8 byte length (an upper bound)
+    tiktoken = None
+
 from ..config import Config
 
+# Recent query embeddings kept per Embedder (repeat queries skip the API)
+QUERY_CACHE_SIZE = 128
+
 
 class Embedder:
     """Handles embedding generation using OpenAI-compatible API."""
 
-    def __init__(self, model: str = None, api_key: str = None, base_url: str = None):
+    def __init__(
+        self,
+        model: str = None,
+        api_key: str = None,
+        base_url: str = None,
+        batch_size: int = None,
+        max_concurrency: int = None,
+        max_batch_tokens: int = None,
+        cache=None,
+    ):
         """
         Initialize the embedder.
 
@@ -24,10 +44,19 @@ class Embedder:
             model: Embedding model name (defaults to Config.EMBEDDING_MODEL)
             api_key: API key (defaults to Config.EMBEDDING_API_KEY)
             base_url: API base URL (defaults to Config.EMBEDDING_BASE_URL)
+            batch_size: Max texts per API request (defaults to Config.EMBEDDING_BATCH_SIZE)
+            max_concurrency: Max requests in flight (defaults to Config.EMBEDDING_MAX_CONCURRENCY)
+            max_batch_tokens: Max input tokens per request (defaults to Config.EMBEDDING_MAX_BATCH_TOKENS)
+            cache: Optional EmbeddingCache; when given, embed() only sends texts
+                it has not embedded before (keyed by model and content)
         """
         self.model = model or Config.EMBEDDING_MODEL
         self.api_key = api_key or Config.EMBEDDING_API_KEY
         self.base_url = base_url or Config.EMBEDDING_BASE_URL
+        self.batch_size = batch_size or Config.EMBEDDING_BATCH_SIZE
+        self.max_concurrency = max_concurrency or Config.EMBEDDING_MAX_CONCURRENCY
+        self.max_batch_tokens = max_batch_tokens or Config.EMBEDDING_MAX_BATCH_TOKENS
+        self.cache = cache
 
         if not self.api_key:
             raise ValueError("Embedding API key is required. Set EMBEDDING_API_KEY in environment.")
@@ -36,35 +65,147 @@ class Embedder:
             raise ValueError("Embedding API base URL is required. Set EMBEDDING_BASE_URL in environment.")
 
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._encoding = None
 
     def embed(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
 
+        Texts are packed greedily into batches of at most `batch_size` inputs
+        and `max_batch_tokens` tokens so large corpora stay under the API's
+        per-request limits. Batches are sent
+        concurrently (up to `max_concurrency` at a time) and reassembled in
+        input order. Vectors are returned as float32: the API's precision
+        is well within it, and it halves the bytes every similarity
+        computation has to stream.
+
         Args:
             texts: List of text strings to embed
 
         Returns:
-            NumPy array of embeddings (n_texts x embedding_dim)
+            float32 NumPy array of embeddings (n_texts x embedding_dim)
 
         Raises:
             ValueError: If texts is empty
         """
         if not texts:
-            return np.array([])
+            return np.array([], dtype=np.float32)
+
+        if self.cache is not None:
+            return self.cache.embed_texts(texts, self._embed_uncached, self.model)
+
+        return self._embed_uncached(texts)
+
+    def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts through the API (batched and concurrent), bypassing any cache.
+
+        Args:
+            texts: Non-empty list of text strings
+
+        Returns:
+            float32 NumPy array of embeddings (n_texts x embedding_dim)
+        """
+        batches = self._make_batches(texts)
+
+        if len(batches) == 1:
+            return np.array(self._embed_batch(batches[0]), dtype=np.float32)
+
+        # Requests are network-bound, so overlap them; map() preserves order
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._embed_batch, batches)
+            embeddings = [embedding for batch in results for embedding in batch]
+
+        return np.array(embeddings, dtype=np.float32)
+
+    def _make_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Pack texts greedily into batches respecting both per-request limits.
 
+        A text is never split: one larger than max_batch_tokens gets a batch
+        of its own (and the API reports the error for it).
+
+        Args:
+            texts: Texts to embed, in order
+
+        Returns:
+            Consecutive batches covering texts in order
+        """
+        # UTF-8 bytes bound the token count from above, so when they already
+        # fit the token limit only the input-count limit matters
+        byte_counts = [len(text.encode()) for text in texts]
+        if sum(byte_counts) <= self.max_batch_tokens:
+            return [
+                texts[i : i + self.batch_size]
+                for i in range(0, len(texts), self.batch_size)
+            ]
+
+        token_counts = self._count_tokens(texts) or byte_counts
+
+        batches = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text, num_tokens in zip(texts, token_counts):
+            if batch and (len(batch) >= self.batch_size
+                          or batch_tokens + num_tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += num_tokens
+        batches.append(batch)
+
+        return batches
+
+    def _count_tokens(self, texts: List[str]) -> Optional[List[int]]:
+        """
+        Count tokens per text with the model's tiktoken encoding.
+
+        Returns:
+            Token counts, or None if tiktoken or its encoding is unavailable
+        """
+        if tiktoken is None:
+            return None
+
+        if self._encoding is None:
+            try:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                # e.g. the encoding file cannot be downloaded
+                return None
+
+        return [len(ids) for ids in self._encoding.encode_ordinary_batch(texts)]
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed a single batch of texts with one API request.
+
+        Args:
+            batch: List of text strings (at most batch_size items)
+
+        Returns:
+            List of embedding vectors in input order
+        """
         response = self.client.embeddings.create(
             model=self.model,
-            input=texts
+            input=batch
         )
 
-        embeddings = [item.embedding for item in response.data]
-        return np.array(embeddings)
+        return [item.embedding for item in response.data]
 
     def embed_query(self, query: str) -> np.ndarray:
         """
         Generate embedding for a single query.
 
+        The last QUERY_CACHE_SIZE distinct queries are remembered, so asking
+        for the same query again costs no API call. The cache is safe to use
+        from several threads (the API call itself runs outside the lock).
+
         Args:
             query: Query string
 
@@ -77,7 +218,21 @@ class Embedder:
         if not query:
             raise ValueError("Query string cannot be empty")
 
-        return self.embed([query])[0]
+        with self._query_cache_lock:
+            cached = self._query_cache.get(query)
+            if cached is not None:
+                self._query_cache.move_to_end(query)
+                return cached.copy()
+
+        # Queries skip the persistent EmbeddingCache: the LRU above covers
+        # repeats, and one-off queries would only grow the on-disk store
+        embedding = self._embed_uncached([query])[0]
+        with self._query_cache_lock:
+            self._query_cache[query] = embedding
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+        return embedding.copy()
 
     def get_embedding_dimension(self) -> int:
         """
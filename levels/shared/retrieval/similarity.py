@@ -5,7 +5,177 @@ Provides efficient implementations of similarity metrics used in RAG systems.
 """
 
 import numpy as np
-from typing import Union
+from typing import Tuple, Union
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional accelerator; top_k_dot falls back to NumPy
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Rows handled per parallel task in the Numba top-k kernel
+_KERNEL_TILE_ROWS = 64
+
+
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize embeddings into a contiguous float32 array.
+
+    Normalizing once at index time turns every later cosine similarity into
+    a plain dot product, so queries skip re-normalizing the whole matrix.
+
+    Args:
+        embeddings: 1D vector or 2D array (n_vectors x embedding_dim)
+
+    Returns:
+        C-contiguous float32 array of unit vectors (zero vectors are left as zeros)
+    """
+    normalized = np.array(embeddings, dtype=np.float32, order="C")
+
+    if normalized.size == 0:
+        return normalized
+
+    norms = np.linalg.norm(normalized, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized /= norms
+
+    return normalized
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, sorted by descending score.
+
+    Uses argpartition to select the top k in O(n) and only sorts those k,
+    instead of sorting every score.
+
+    Args:
+        scores: 1D array of scores
+        k: Number of indices to return
+
+    Returns:
+        1D array of at most k indices, highest score first
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _top_k_dot_tiles(matrix: np.ndarray, query: np.ndarray, k: int):
+    """
+    Per-tile top-k of matrix @ query, fused into a single pass.
+
+    Each tile of rows keeps its own k best (score, row) pairs in descending
+    order via insertion, so no full score array is materialized or sorted.
+    Candidates from all tiles are merged by the caller.
+    """
+    n_rows, dim = matrix.shape
+    n_tiles = (n_rows + _KERNEL_TILE_ROWS - 1) // _KERNEL_TILE_ROWS
+    # Finite sentinel: fastmath lets the compiler assume no infinities
+    best_scores = np.full((n_tiles, k), np.finfo(np.float32).min, dtype=np.float32)
+    best_rows = np.full((n_tiles, k), -1, dtype=np.int64)
+
+    for tile in prange(n_tiles):
+        start = tile * _KERNEL_TILE_ROWS
+        end = min(start + _KERNEL_TILE_ROWS, n_rows)
+        for row in range(start, end):
+            score = 0.0
+            for j in range(dim):
+                score += matrix[row, j] * query[j]
+
+            if score > best_scores[tile, k - 1]:
+                pos = k - 1
+                while pos > 0 and best_scores[tile, pos - 1] < score:
+                    best_scores[tile, pos] = best_scores[tile, pos - 1]
+                    best_rows[tile, pos] = best_rows[tile, pos - 1]
+                    pos -= 1
+                best_scores[tile, pos] = score
+                best_rows[tile, pos] = row
+
+    return best_scores.ravel(), best_rows.ravel()
+
+
+def _dot_rows(matrix: np.ndarray, query: np.ndarray, out: np.ndarray) -> None:
+    """Write matrix @ query into out, one row per parallel iteration."""
+    n_rows, dim = matrix.shape
+    for row in prange(n_rows):
+        score = 0.0
+        for j in range(dim):
+            score += matrix[row, j] * query[j]
+        out[row] = score
+
+
+if NUMBA_AVAILABLE:
+    _top_k_dot_kernel = njit(parallel=True, fastmath=True, cache=True)(_top_k_dot_tiles)
+    _dot_rows_kernel = njit(parallel=True, fastmath=True, cache=True)(_dot_rows)
+
+
+def dot_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Compute matrix @ query, multi-core via Numba when available.
+
+    For unit-normalized rows and query this is cosine similarity. float32
+    inputs go through a parallel Numba kernel writing into a preallocated
+    output; anything else (or no Numba) uses NumPy's matrix-vector product.
+
+    Args:
+        matrix: 2D array (n_rows x dim)
+        query: 1D array (dim,)
+
+    Returns:
+        1D array of scores, one per row
+    """
+    if NUMBA_AVAILABLE and matrix.dtype == np.float32 and query.dtype == np.float32:
+        out = np.empty(len(matrix), dtype=np.float32)
+        _dot_rows_kernel(np.ascontiguousarray(matrix), query, out)
+        return out
+
+    return np.dot(matrix, query)
+
+
+def top_k_dot(
+    matrix: np.ndarray,
+    query: np.ndarray,
+    k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of matrix with the highest dot product against query.
+
+    For unit-normalized rows and query this is top-k cosine similarity. With
+    Numba installed, float32 inputs go through a parallel kernel that fuses
+    the dot products with top-k selection; otherwise a matrix-vector product
+    followed by top_k_indices is used.
+
+    Args:
+        matrix: 2D array (n_rows x dim)
+        query: 1D array (dim,)
+        k: Number of rows to return
+
+    Returns:
+        Tuple of (row indices, scores), highest score first
+    """
+    k = min(k, len(matrix))
+    if k <= 0:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.float32)
+
+    if NUMBA_AVAILABLE and matrix.dtype == np.float32 and query.dtype == np.float32:
+        scores, rows = _top_k_dot_kernel(np.ascontiguousarray(matrix), query, k)
+        valid = rows >= 0
+        scores, rows = scores[valid], rows[valid]
+    else:
+        scores = np.dot(matrix, query)
+        rows = np.arange(len(scores))
+
+    top = top_k_indices(scores, k)
+    return rows[top], scores[top]
 
 
 def cosine_similarity(
@@ -36,24 +206,20 @@ def cosine_similarity(
     if query_embedding.ndim != 1:
         raise ValueError("query_embedding must be 1D array")
 
-    # Handle 1D doc_embeddings (single document)
-    if doc_embeddings.ndim == 1:
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        doc_norm = doc_embeddings / np.linalg.norm(doc_embeddings)
-        return np.dot(query_norm, doc_norm)
-
-    # Handle 2D doc_embeddings (multiple documents)
-    if doc_embeddings.ndim != 2:
+    if doc_embeddings.ndim > 2:
         raise ValueError("doc_embeddings must be 1D or 2D array")
 
-    # Normalize vectors
-    query_norm = query_embedding / np.linalg.norm(query_embedding)
-    doc_norms = doc_embeddings / np.linalg.norm(doc_embeddings, axis=1, keepdims=True)
+    # Scale the raw dot products by the norms instead of normalizing a copy of
+    # the whole matrix (for repeated queries, normalize documents once with
+    # normalize_embeddings and take a plain dot product instead). einsum
+    # computes the row norms without a temporary matrix.
+    doc_norms = np.sqrt(np.einsum("...j,...j->...", doc_embeddings, doc_embeddings))
+    denominators = doc_norms * np.linalg.norm(query_embedding)
 
-    # Compute dot product (cosine similarity for normalized vectors)
-    similarities = np.dot(doc_norms, query_norm)
+    # Zero vectors score 0 rather than dividing by zero
+    denominators = np.where(denominators == 0, 1.0, denominators)
 
-    return similarities
+    return np.dot(doc_embeddings, query_embedding) / denominators
 
 
 def euclidean_distance(
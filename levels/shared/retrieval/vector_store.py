@@ -17,6 +17,11 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    HnswConfigDiff,
+    SearchParams,
 )
 
 from ..config import Config
@@ -111,6 +116,7 @@ class QdrantVectorStore(VectorStore):
         port: int = None,
         api_key: str = None,
         use_https: bool = None,
+        int8_quantization: bool = None,
     ):
         """
         Initialize Qdrant vector store.
@@ -120,11 +126,18 @@ class QdrantVectorStore(VectorStore):
             port: Qdrant port (defaults to Config.QDRANT_PORT)
             api_key: Qdrant API key (defaults to Config.QDRANT_API_KEY)
             use_https: Use HTTPS connection (defaults to Config.QDRANT_USE_HTTPS)
+            int8_quantization: Quantize stored vectors to int8 for search
+                (defaults to Config.QDRANT_INT8_QUANTIZATION)
         """
         self.host = host or Config.QDRANT_HOST
         self.port = port or Config.QDRANT_PORT
         self.api_key = api_key or Config.QDRANT_API_KEY
         self.use_https = use_https if use_https is not None else Config.QDRANT_USE_HTTPS
+        self.int8_quantization = (
+            int8_quantization
+            if int8_quantization is not None
+            else Config.QDRANT_INT8_QUANTIZATION
+        )
 
         self.client = QdrantClient(
             host=self.host,
@@ -145,9 +158,26 @@ class QdrantVectorStore(VectorStore):
         if self.collection_exists(collection_name):
             self.delete_collection(collection_name)
 
+        # Scalar int8 quantization shrinks the scanned vectors 4x; Qdrant
+        # rescores the best candidates with the original float vectors
+        quantization_config = None
+        if self.int8_quantization:
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            )
+
         self.client.create_collection(
             collection_name=collection_name,
             vectors_config=VectorParams(size=vector_dim, distance=Distance.COSINE),
+            hnsw_config=HnswConfigDiff(
+                m=Config.QDRANT_HNSW_M,
+                ef_construct=Config.QDRANT_HNSW_EF_CONSTRUCT,
+            ),
+            quantization_config=quantization_config,
         )
 
     def add_vectors(
@@ -211,6 +241,53 @@ class QdrantVectorStore(VectorStore):
         Returns:
             List of (id, score) tuples sorted by similarity
         """
+        # Only the doc_id is needed, so skip transferring the rest of the payload
+        results = self._query(
+            collection_name, query_vector, top_k, filter_conditions, with_payload=["doc_id"]
+        )
+
+        # Return the original doc_id from payload instead of the UUID
+        return [(result.payload.get("doc_id", str(result.id)), result.score) for result in results]
+
+    def search_with_payload(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        top_k: int = 5,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Search for similar vectors and return their payloads in the same call.
+
+        Avoids a get_metadata() round trip per hit when results are displayed.
+
+        Args:
+            collection_name: Name of the collection
+            query_vector: Query vector
+            top_k: Number of results to return
+            filter_conditions: Optional metadata filters
+
+        Returns:
+            List of (id, score, payload) tuples sorted by similarity
+        """
+        results = self._query(
+            collection_name, query_vector, top_k, filter_conditions, with_payload=True
+        )
+
+        return [
+            (result.payload.get("doc_id", str(result.id)), result.score, result.payload)
+            for result in results
+        ]
+
+    def _query(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        top_k: int,
+        filter_conditions: Optional[Dict[str, Any]],
+        with_payload,
+    ) -> list:
+        """Run a Qdrant similarity search with the configured HNSW parameters."""
         query_filter = None
         if filter_conditions:
             conditions = [
@@ -219,16 +296,15 @@ class QdrantVectorStore(VectorStore):
             ]
             query_filter = Filter(must=conditions)
 
-        results = self.client.search(
+        return self.client.search(
             collection_name=collection_name,
             query_vector=query_vector.tolist(),
             limit=top_k,
             query_filter=query_filter,
+            search_params=SearchParams(hnsw_ef=max(Config.QDRANT_HNSW_EF, top_k)),
+            with_payload=with_payload,
         )
 
-        # Return the original doc_id from payload instead of the UUID
-        return [(result.payload.get("doc_id", str(result.id)), result.score) for result in results]
-
     def delete_collection(self, collection_name: str) -> None:
         """
         Delete a Qdrant collection.
@@ -298,6 +374,32 @@ class QdrantVectorStore(VectorStore):
         except Exception:
             return None
 
+    def get_metadata_batch(
+        self, collection_name: str, vector_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata for several vectors in one request.
+
+        Args:
+            collection_name: Name of the collection
+            vector_ids: Original doc_ids of the vectors
+
+        Returns:
+            Mapping of doc_id to metadata for the ids that were found
+        """
+        if not vector_ids:
+            return {}
+
+        doc_id_of = {str(uuid.uuid5(uuid.NAMESPACE_DNS, vector_id)): vector_id for vector_id in vector_ids}
+        try:
+            points = self.client.retrieve(
+                collection_name=collection_name, ids=list(doc_id_of), with_vectors=False
+            )
+        except Exception:
+            return {}
+
+        return {doc_id_of[str(point.id)]: point.payload for point in points if str(point.id) in doc_id_of}
+
     def count_vectors(self, collection_name: str) -> int:
         """
         Count the number of vectors in a collection.
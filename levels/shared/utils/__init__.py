@@ -1,5 +1,6 @@
 """Utility functions for RAG system."""
 
 from .logger import setup_logger
+from .text import make_preview
 
-__all__ = ["setup_logger"]
+__all__ = ["setup_logger", "make_preview"]
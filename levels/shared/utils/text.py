@@ -0,0 +1,24 @@
+"""
+Text helpers shared across training levels.
+"""
+
+
+def make_preview(text: str, max_chars: int = 200) -> str:
+    """
+    Truncate text for display, appending "..." when it was cut.
+
+    Only the first max_chars + 1 characters are copied, so long documents are
+    never sliced twice.
+
+    Args:
+        text: Text to preview
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        The text itself if short enough, otherwise its first max_chars
+        characters followed by "..."
+    """
+    head = text[:max_chars + 1]
+    if len(head) > max_chars:
+        return head[:max_chars] + "..."
+    return text